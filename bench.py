@@ -0,0 +1,311 @@
+"""Benchmark suite for the calculator engines and graph renderer
+
+Usage:
+    python bench.py                     # run and compare against bench_baseline.json
+    python bench.py --save-baseline     # run and store results as the new baseline
+    python bench.py --filter programmer --threshold 0.10
+
+GUI benchmarks (mode switching, canvas rendering) need a display; on a
+headless machine run them under a virtual one, e.g. `xvfb-run python bench.py`.
+Without a display they are skipped and the engine benchmarks still run.
+
+The committed bench_baseline.json was recorded on the machine described by
+its "_machine" entry (a single-core x86-64 Linux VM, Python 3.11, NumPy
+installed, no display). Timings from other hardware are not comparable:
+re-record with --save-baseline before relying on the threshold there.
+Benchmarks marked noisy (microsecond-scale calls, where scheduling jitter
+alone moves timings by 25% or more between runs) are allowed twice the
+threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import timeit
+from datetime import date, timedelta
+
+import calc
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")
+BENCHMARKS = []
+NOISY_FACTOR = 2  # threshold multiplier for noisy benchmarks
+_app = None
+
+
+def benchmark(name, gui=False, noisy=False):
+    """Register a benchmark; the decorated function does setup and returns the timed callable"""
+    def register(setup):
+        BENCHMARKS.append((name, gui, noisy, setup))
+        return setup
+    return register
+
+
+# Engine benchmarks
+
+@benchmark("math_engine.evaluate", noisy=True)
+def bench_evaluate():
+    engine = calc.MathEngine()
+    return lambda: engine.evaluate("12.5 × (3 + 4) ÷ 7 - sqrt(16) + sin(0.5)")
+
+
+@benchmark("conversion.convert", noisy=True)
+def bench_convert():
+    """100 conversions per call: a single one is too short to time reliably"""
+    service = calc.ConversionService()
+    values = [0.5 * i for i in range(100)]
+    return lambda: [service.convert(v, "Length", "Miles", "Kilometers") for v in values]
+
+
+@benchmark("conversion.convert_temperature", noisy=True)
+def bench_convert_temperature():
+    service = calc.ConversionService()
+    return lambda: service.convert(98.6, "Temperature", "Fahrenheit", "Kelvin")
+
+
+@benchmark("programmer.convert_base", noisy=True)
+def bench_convert_base():
+    prog = calc.ProgrammerCalculator()
+    return lambda: prog.convert_base("DEADBEEF", 16, 2)
+
+
+@benchmark("programmer.bitwise_operation", noisy=True)
+def bench_bitwise():
+    prog = calc.ProgrammerCalculator()
+    return lambda: prog.bitwise_operation(0xF0F0, 0x0FF0, "XOR")
+
+
+@benchmark("programmer.evaluate", noisy=True)
+def bench_programmer_evaluate():
+    prog = calc.ProgrammerCalculator()
+    return lambda: prog.evaluate("(1F + 3) * 7 AND FF XOR 5 << 2", 16)
+
+
+@benchmark("history.add", noisy=True)
+def bench_history_add():
+    history = calc.HistoryManager()
+    return lambda: history.add("2 + 2", 4)
+
+
+@benchmark("history.search")
+def bench_history_search():
+    history = calc.HistoryManager()
+    for i in range(history.max_items):
+        history.add(f"{i} × {i + 1}", i * (i + 1))
+    return lambda: history.search("× 4")
+
+
+@benchmark("date.difference", noisy=True)
+def bench_date_difference():
+    calculator = calc.DateCalculator()
+    start, end = date(2001, 3, 17), date(2024, 11, 5)
+    calculator.difference(start, end)  # build the business-day index outside the timing
+    return lambda: calculator.difference(start, end)
+
+
+@benchmark("date.add_business_days", noisy=True)
+def bench_add_business_days():
+    """100 offsets per call from starts spread over a year"""
+    calculator = calc.DateCalculator()
+    starts = [date(2024, 1, 1) + timedelta(days=3 * i) for i in range(100)]
+
+    def offset_all():
+        return [calculator.add_days(start, 250, business=True) for start in starts]
+    offset_all()  # build the business-day index outside the timing
+    return offset_all
+
+
+@benchmark("currency.rate_as_of", noisy=True)
+def bench_rate_as_of():
+    path = os.path.join(tempfile.mkdtemp(), "rates.crh")
+    first = date(2000, 1, 3)
+    store = calc.RateHistoryStore.build(path, {
+        "EUR": [(first + timedelta(days=i), 0.8 + (i % 100) / 1000) for i in range(9000)]
+    })
+    return lambda: store.rate_as_of("EUR", "2015-06-30")
+
+
+@benchmark("graph.sample")
+def bench_graph_sample():
+    engine = calc.GraphEngine()
+    return lambda: engine.sample("x**3 / 10 - 2*x + sin(x)", 400, 300)
+
+
+@benchmark("graph.analyze")
+def bench_graph_analyze():
+    engine = calc.GraphEngine()
+    analyzer = calc.GraphAnalyzer(engine)
+    equation = "x**3 / 10 - 2*x + sin(x)"
+    engine.sample(equation, 400, 300)
+
+    def analyze():
+        analyzer.roots(equation)
+        analyzer.extrema(equation)
+        analyzer.integrate(equation, -3, 4)
+    return analyze
+
+
+@benchmark("series.closed_form")
+def bench_series_closed_form():
+    engine = calc.MathEngine()
+    return lambda: engine.evaluate("Σ((n + 1)**3 / 2, n, 1, 10**8) + Σ(3 * 0.5**n, n, 0, 60)")
+
+
+if calc.np is not None:
+    @benchmark("series.sum_1m")
+    def bench_series_sum():
+        engine = calc.MathEngine()
+        return lambda: engine.evaluate("Σ(sin(n) / n**2, n, 1, 10**6)")
+
+    @benchmark("batch_date.differences_10k")
+    def bench_batch_differences():
+        engine = calc.BatchDateEngine()
+        rng = random.Random(42)
+        first = date(2000, 1, 1)
+        starts = [(first + timedelta(days=rng.randrange(9000))).isoformat() for _ in range(10000)]
+        ends = [(first + timedelta(days=rng.randrange(9000))).isoformat() for _ in range(10000)]
+        return lambda: engine.differences(starts, ends, business=True)
+
+
+# GUI benchmarks
+
+def _make_app():
+    """The shared calculator window; GUI benchmarks reset it via switch_mode"""
+    global _app
+    if _app is None:
+        _app = calc.WindowsCalculator()
+        _app.withdraw()
+        _app.update()
+    return _app
+
+
+@benchmark("gui.switch_mode", gui=True)
+def bench_switch_mode():
+    app = _make_app()
+    modes = list(calc.CalculatorMode)
+
+    def switch_all():
+        for mode in modes:
+            app.switch_mode(mode)
+        app.update_idletasks()
+    return switch_all
+
+
+@benchmark("gui.plot_graph", gui=True)
+def bench_plot_graph():
+    app = _make_app()
+    app.switch_mode(calc.CalculatorMode.GRAPHING)
+
+    def plot():
+        app.plot_graph()
+        app.update_idletasks()
+    return plot
+
+
+@benchmark("gui.render_graph", gui=True)
+def bench_render_graph():
+    app = _make_app()
+    app.switch_mode(calc.CalculatorMode.GRAPHING)
+    points = app.graph_engine.sample("x**3 / 10 - 2*x + sin(x)", 400, 300)
+
+    def render():
+        app.graph_canvas.delete("all")
+        app.render_graph(points, 400, 300)
+        app.update_idletasks()
+    return render
+
+
+def measure(func, repeat=5, min_time=0.2):
+    """Best-of-repeat seconds per call, with the loop count auto-calibrated"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def display_available():
+    try:
+        calc.tk.Tk().destroy()
+        return True
+    except calc.tk.TclError:
+        return False
+
+
+def machine_description():
+    """Description of this machine, stored in the baseline under "_machine"."""
+    return {"platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpus": os.cpu_count(), "python": platform.python_version(),
+            "numpy": calc.np.__version__ if calc.np is not None else None}
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run calculator benchmarks")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run's results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown vs baseline before failing (0.25 = 25%%)")
+    parser.add_argument("--filter", default="", help="only run benchmarks containing this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    has_display = display_available()
+    results, regressions = {}, []
+    random.seed(0)
+
+    for name, gui, noisy, setup in BENCHMARKS:
+        if args.filter not in name:
+            continue
+        if gui and not has_display:
+            print(f"{name:34} skipped (no display; try xvfb-run)")
+            continue
+
+        seconds = measure(setup(), repeat=args.repeat)
+        if gui:
+            _app.switch_mode(calc.CalculatorMode.STANDARD)
+        results[name] = seconds
+        line = f"{name:34} {format_time(seconds)}"
+        if name in baseline:
+            change = seconds / baseline[name] - 1
+            line += f"   baseline {format_time(baseline[name])}   {change:+7.1%}"
+            if change > args.threshold * (NOISY_FACTOR if noisy else 1):
+                regressions.append(name)
+                line += "   REGRESSION"
+        print(line)
+
+    if _app is not None:
+        _app.destroy()
+
+    if args.save_baseline:
+        baseline.update(results)
+        baseline["_machine"] = machine_description()
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.baseline}")
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than baseline by more than "
+              f"{args.threshold:.0%} ({args.threshold * NOISY_FACTOR:.0%} if noisy): "
+              f"{', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,34 @@
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog
 import math
+import ast
+import atexit
+import bisect
+import operator
+import csv
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+from collections import ChainMap, OrderedDict
+from itertools import islice
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal, getcontext
-from datetime import datetime, timedelta
+from fractions import Fraction
+from datetime import date, datetime, timedelta
 import re
 from enum import Enum
+from functools import lru_cache, wraps
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; vectorized paths fall back to pure Python
+    np = None
 
 # Set high precision for calculations
 getcontext().prec = 50
@@ -17,46 +41,299 @@ class CalculatorMode(Enum):
     DATE = "Date Calculation"
     CONVERTER = "Converter"
     GRAPHING = "Graphing"
+    TABLE = "Table of Values"
+    MATRIX = "Matrix"
+    STATISTICS = "Statistics"
+
+
+class PerfMonitor:
+    """Low-overhead counters, latency histograms and cache statistics for hot paths
+    
+    Latencies go into power-of-two microsecond buckets, so recording is a
+    few dict and list operations. Disable with `enabled = False`.
+    """
+    
+    BUCKETS = 32  # bucket i holds latencies below 2**i microseconds
+    
+    def __init__(self):
+        self.enabled = True
+        self.reset()
+        self._cache_providers = {}
+    
+    def reset(self):
+        """Clear all collected data"""
+        self.started = time.time()
+        self.timings = {}  # name -> [count, total seconds, max seconds, histogram]
+        self.counters = {}
+        self.caches = {}  # name -> [hits, misses]
+    
+    def record(self, name, seconds):
+        """Record one latency sample"""
+        stats = self.timings.get(name)
+        if stats is None:
+            stats = self.timings[name] = [0, 0.0, 0.0, [0] * self.BUCKETS]
+        stats[0] += 1
+        stats[1] += seconds
+        if seconds > stats[2]:
+            stats[2] = seconds
+        stats[3][min(int(seconds * 1e6).bit_length(), self.BUCKETS - 1)] += 1
+    
+    def count(self, name, n=1):
+        """Increment a counter"""
+        self.counters[name] = self.counters.get(name, 0) + n
+    
+    def cache_hit(self, name):
+        self.caches.setdefault(name, [0, 0])[0] += 1
+    
+    def cache_miss(self, name):
+        self.caches.setdefault(name, [0, 0])[1] += 1
+    
+    def register_cache(self, name, cached_function):
+        """Report a functools.lru_cache-wrapped function's hit rate"""
+        self._cache_providers[name] = cached_function
+    
+    def timed(self, name):
+        """Decorator recording the call latency of a function under name"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+    
+    def snapshot(self):
+        """Return all statistics as JSON-serializable data"""
+        timings = {}
+        for name, (count, total, longest, histogram) in self.timings.items():
+            timings[name] = {
+                "count": count,
+                "total_ms": total * 1e3,
+                "mean_ms": total / count * 1e3 if count else 0.0,
+                "max_ms": longest * 1e3,
+                "histogram_us": {f"<{1 << i}": n for i, n in enumerate(histogram) if n}
+            }
+        caches = {name: (hits, misses) for name, (hits, misses) in self.caches.items()}
+        for name, cached_function in self._cache_providers.items():
+            info = cached_function.cache_info()
+            caches[name] = (info.hits, info.misses)
+        return {
+            "uptime_s": time.time() - self.started,
+            "timings": timings,
+            "counters": dict(self.counters),
+            "caches": {name: {"hits": hits, "misses": misses,
+                              "hit_rate": hits / (hits + misses) if hits + misses else 0.0}
+                       for name, (hits, misses) in caches.items()}
+        }
+    
+    def export_json(self, path):
+        """Write a snapshot to a JSON file"""
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+# Shared monitor for the engines and the GUI
+PERF = PerfMonitor()
+
+
+class StallDetector:
+    """Detects Tk mainloop stalls from the lateness of an after() heartbeat"""
+    
+    def __init__(self, widget, interval_ms=100, threshold_ms=250, monitor=PERF):
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.monitor = monitor
+        self._expected = None
+        self._job = None
+    
+    def start(self):
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._job = self.widget.after(self.interval_ms, self._beat)
+    
+    def stop(self):
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+    
+    def _beat(self):
+        now = time.perf_counter()
+        lag = max(now - self._expected, 0.0)
+        if self.monitor.enabled:
+            self.monitor.record("mainloop.heartbeat_lag", lag)
+            if lag * 1000 >= self.threshold_ms:
+                self.monitor.count("mainloop.stalls")
+                self.monitor.record("mainloop.stall", lag)
+        self._expected = now + self.interval_ms / 1000
+        self._job = self.widget.after(self.interval_ms, self._beat)
+
+
+_SAFE_BINOPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+_SAFE_UNARYOPS = (ast.UAdd, ast.USub, ast.Not)
+_SAFE_COMPARE = (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+_SERIES_FUNCTIONS = ("_sum", "_prod")
+
+
+def _check_expression(node):
+    """Raise ValueError unless node is numbers, arithmetic, comparisons, names and plain calls
+    
+    Expressions are eval'd (also for calc_server clients), so attribute
+    access, subscripts, comprehensions and dunder names must never get there.
+    Series calls may pass their term and variable as strings; the term is
+    checked the same way.
+    """
+    if isinstance(node, ast.Expression):
+        _check_expression(node.body)
+    elif isinstance(node, ast.Constant):
+        if type(node.value) not in (int, float, complex):
+            raise ValueError(f"Unsupported constant: {node.value!r}")
+    elif isinstance(node, ast.Name):
+        if "__" in node.id:
+            raise ValueError(f"Unsupported name: {node.id}")
+    elif isinstance(node, ast.BinOp) and isinstance(node.op, _SAFE_BINOPS):
+        _check_expression(node.left)
+        _check_expression(node.right)
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, _SAFE_UNARYOPS):
+        _check_expression(node.operand)
+    elif isinstance(node, ast.Compare) and all(isinstance(op, _SAFE_COMPARE) for op in node.ops):
+        # Piecewise equations such as (x > 0) * x
+        _check_expression(node.left)
+        for comparator in node.comparators:
+            _check_expression(comparator)
+    elif isinstance(node, ast.BoolOp):
+        for value in node.values:
+            _check_expression(value)
+    elif isinstance(node, ast.IfExp):
+        _check_expression(node.test)
+        _check_expression(node.body)
+        _check_expression(node.orelse)
+    elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        _check_expression(node.func)
+        args = node.args
+        if (node.func.id in _SERIES_FUNCTIONS and len(args) == 4
+                and all(isinstance(a, ast.Constant) and isinstance(a.value, str) for a in args[:2])):
+            term, var = args[0].value, args[1].value
+            if not var.isidentifier() or "__" in var:
+                raise ValueError(f"Unsupported name: {var}")
+            _check_expression(ast.parse(term, mode="eval"))
+            args = args[2:]
+        for arg in args:
+            _check_expression(arg)
+    else:
+        raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+
+
+def _compile_expression(source, filename="<expression>"):
+    """Parse, check against the allowlist above and compile for eval"""
+    tree = ast.parse(source, mode="eval")
+    _check_expression(tree)
+    return compile(tree, filename, "eval")
 
 
 class MathEngine:
     """Core calculation engine with expression evaluation"""
     
+    CACHE_SIZE = 1024
+    _SERIES_CALL = re.compile(r"(Σ|Π|\bsum\b|\bprod\b)\s*\(")
+    NAMESPACE = {
+        "sin": math.sin, "cos": math.cos, "tan": math.tan,
+        "asin": math.asin, "acos": math.acos, "atan": math.atan,
+        "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh,
+        "asinh": math.asinh, "acosh": math.acosh, "atanh": math.atanh,
+        "log": math.log, "log10": math.log10, "sqrt": math.sqrt,
+        "exp": math.exp, "pow": pow, "abs": abs,
+        "factorial": math.factorial, "pi": math.pi, "e": math.e
+    }
+    
     def __init__(self):
         self.memory = Decimal('0')
         self.history = []
+        self._compiled = {}
+        self.namespace = SeriesEvaluator.extend_namespace(dict(self.NAMESPACE))
         
-    def evaluate(self, expression):
-        """Safely evaluate mathematical expression"""
+    @PERF.timed("evaluate")
+    def evaluate(self, expression, namespace=None):
+        """Safely evaluate mathematical expression
+        
+        namespace replaces the built-in names, e.g. to add user variables.
+        """
         try:
-            # Replace operators for Python evaluation
-            expr = expression.replace('×', '*').replace('÷', '/')
-            expr = expr.replace('π', str(math.pi)).replace('e', str(math.e))
-            
-            # Handle special functions
-            expr = self._process_functions(expr)
+            result = eval(self._compile(expression), {"__builtins__": {}},
+                          self.namespace if namespace is None else namespace)
             
-            result = eval(expr, {"__builtins__": {}}, {
-                "sin": math.sin, "cos": math.cos, "tan": math.tan,
-                "asin": math.asin, "acos": math.acos, "atan": math.atan,
-                "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh,
-                "asinh": math.asinh, "acosh": math.acosh, "atanh": math.atanh,
-                "log": math.log, "log10": math.log10, "sqrt": math.sqrt,
-                "exp": math.exp, "pow": pow, "abs": abs,
-                "factorial": math.factorial, "pi": math.pi, "e": math.e
-            })
-            
-            return Decimal(str(result))
+            # Comparisons give bools; show them as 1/0 like the rest of the calculator
+            return Decimal(str(int(result) if isinstance(result, bool) else result))
         except Exception as e:
             raise ValueError(f"Invalid expression: {e}")
     
+    def _compile(self, expression):
+        """Translate and compile an expression, caching the code object"""
+        code = self._compiled.get(expression)
+        if code is not None:
+            PERF.cache_hit("evaluate.compile")
+            return code
+        PERF.cache_miss("evaluate.compile")
+        
+        code = _compile_expression(self.translate(expression))
+        if len(self._compiled) >= self.CACHE_SIZE:
+            self._compiled.clear()
+        self._compiled[expression] = code
+        return code
+    
+    def translate(self, expression):
+        """Translate calculator notation into a Python expression"""
+        # Replace operators for Python evaluation
+        expr = expression.replace('×', '*').replace('÷', '/')
+        # e is resolved through the namespace so names like exp or rate stay intact
+        expr = expr.replace('π', str(math.pi))
+        
+        # Handle special functions
+        return self._process_functions(expr)
+    
     def _process_functions(self, expr):
         """Process special calculator functions"""
         # Handle x² as x**2
         expr = re.sub(r'(\d+)²', r'\1**2', expr)
         # Handle √x as sqrt(x)
         expr = re.sub(r'√\(([^)]+)\)', r'sqrt(\1)', expr)
-        return expr
+        # Handle Σ(f, n, a, b) and Π(f, n, a, b) as series calls
+        return self._rewrite_series(expr)
+    
+    def _rewrite_series(self, expr):
+        """Rewrite Σ/sum and Π/prod calls to _sum("f", "n", a, b) / _prod(...)"""
+        match = self._SERIES_CALL.search(expr)
+        if not match:
+            return expr
+        
+        # Find the matching parenthesis and split arguments at depth 0
+        depth, args, arg_start = 1, [], match.end()
+        for pos in range(match.end(), len(expr)):
+            char = expr[pos]
+            if char in "([":
+                depth += 1
+            elif char in ")]":
+                depth -= 1
+                if depth == 0:
+                    args.append(expr[arg_start:pos])
+                    break
+            elif char == "," and depth == 1:
+                args.append(expr[arg_start:pos])
+                arg_start = pos + 1
+        else:
+            raise ValueError("Unbalanced parentheses in series")
+        if len(args) != 4 or not args[1].strip().isidentifier():
+            raise ValueError("Series take (expression, variable, start, end)")
+        
+        body, var, start, end = (a.strip() for a in args)
+        function = "_sum" if match.group(1) in ("Σ", "sum") else "_prod"
+        call = (f"{function}({self._rewrite_series(body)!r}, {var!r}, "
+                f"{self._rewrite_series(start)}, {self._rewrite_series(end)})")
+        return expr[:match.start()] + call + self._rewrite_series(expr[pos + 1:])
     
     def add_to_memory(self, value):
         self.memory += Decimal(str(value))
@@ -74,6 +351,471 @@ class MathEngine:
         self.memory = Decimal(str(value))
 
 
+class SeriesEvaluator:
+    """Σ and Π over integer ranges of an expression in one variable
+    
+    Polynomial and geometric terms are summed in closed form (exactly, for
+    rational coefficients). Anything else is evaluated in fixed-size chunks,
+    vectorized with NumPy when possible, using pairwise sums within a chunk
+    and Neumaier compensation across chunks, so memory stays bounded.
+    """
+    
+    CHUNK = 1 << 20
+    MAX_DEGREE = 32
+    FUNCTIONS = _SERIES_FUNCTIONS
+    if np is not None:
+        VECTOR_FUNCTIONS = {
+            "sin": np.sin, "cos": np.cos, "tan": np.tan,
+            "asin": np.arcsin, "acos": np.arccos, "atan": np.arctan,
+            "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+            "asinh": np.arcsinh, "acosh": np.arccosh, "atanh": np.arctanh,
+            "log": np.log, "log10": np.log10, "sqrt": np.sqrt,
+            "exp": np.exp, "pow": np.power, "abs": np.abs
+        }
+    
+    def __init__(self, namespace):
+        self.namespace = namespace
+    
+    @classmethod
+    def extend_namespace(cls, namespace):
+        """Add _sum/_prod bound to namespace (so terms can use its names)"""
+        series = cls(namespace)
+        namespace["_sum"] = series.summation
+        namespace["_prod"] = series.product
+        return namespace
+    
+    @classmethod
+    def free_names(cls, tree):
+        """Names an expression tree reads, including inside series term strings"""
+        names = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                names.add(node.id)
+            elif (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                  and node.func.id in cls.FUNCTIONS and len(node.args) >= 2
+                  and all(isinstance(a, ast.Constant) and isinstance(a.value, str)
+                          for a in node.args[:2])):
+                inner = ast.parse(node.args[0].value, mode="eval")
+                names |= cls.free_names(inner) - {node.args[1].value}
+        return names
+    
+    @PERF.timed("series.sum")
+    def summation(self, term, var, start, end):
+        """Σ term for var = start..end (inclusive)"""
+        start, end = self._bounds(start, end)
+        if end < start:
+            return 0
+        tree = ast.parse(term, mode="eval").body
+        
+        polynomial = self._polynomial(tree, var)
+        if polynomial is not None:
+            return self._number(self._polynomial_sum(polynomial, start, end))
+        exponential = self._exponential(tree, var)
+        if exponential is not None:
+            try:
+                return self._geometric_sum(*exponential, start, end)
+            except OverflowError:
+                pass
+        
+        total, compensation = 0.0, 0.0
+        for chunk in self._chunks(term, var, start, end):
+            # np.sum is pairwise; fsum is exact for the scalar fallback
+            try:
+                if np is not None:
+                    with np.errstate(over="ignore"):
+                        value = float(np.sum(chunk))
+                else:
+                    value = math.fsum(chunk)
+            except OverflowError:
+                value = math.inf
+            t = total + value
+            if not math.isfinite(t):
+                # Terms are finite (checked in _chunks), so the sum overflowed;
+                # stop before (inf - inf) turns the compensation into NaN
+                raise ValueError("Series sum overflows")
+            if abs(total) >= abs(value):
+                compensation += (total - t) + value
+            else:
+                compensation += (value - t) + total
+            total = t
+        return total + compensation
+    
+    @PERF.timed("series.product")
+    def product(self, term, var, start, end):
+        """Π term for var = start..end (inclusive)"""
+        start, end = self._bounds(start, end)
+        if end < start:
+            return 1
+        tree = ast.parse(term, mode="eval").body
+        count = end - start + 1
+        
+        polynomial = self._polynomial(tree, var)
+        if polynomial is not None and len(polynomial) == 1:
+            return self._number(polynomial[0] ** count)
+        if polynomial == [0, 1]:
+            # Π n = end! / (start - 1)!
+            if start <= 0 <= end:
+                return 0
+            if start >= 1:
+                if end <= 1000:
+                    return math.prod(range(start, end + 1))
+                log = math.lgamma(end + 1) - math.lgamma(start)
+                return math.inf if log > 709 else math.exp(log)
+        exponential = self._exponential(tree, var)
+        if exponential is not None:
+            coefficient, base, slope, intercept = exponential
+            try:
+                exponent = slope * self._polynomial_sum([0, 1], start, end) + intercept * count
+                return self._number(coefficient ** count) * base ** float(exponent)
+            except OverflowError:
+                pass
+        
+        # Track mantissa and binary exponent separately to avoid overflow/underflow
+        mantissa, exponent = 1.0, 0
+        for chunk in self._chunks(term, var, start, end):
+            for value in (chunk.tolist() if np is not None else chunk):
+                mantissa, e = math.frexp(mantissa * value)
+                exponent += e
+                if mantissa == 0 or math.isnan(mantissa):
+                    return mantissa
+        try:
+            return math.ldexp(mantissa, exponent)
+        except OverflowError:
+            return math.copysign(math.inf, mantissa)
+    
+    @staticmethod
+    def _bounds(start, end):
+        if start != int(start) or end != int(end):
+            raise ValueError("Series bounds must be integers")
+        return int(start), int(end)
+    
+    @staticmethod
+    def _number(value):
+        """Fractions become ints when whole, floats otherwise"""
+        if isinstance(value, Fraction):
+            return value.numerator if value.denominator == 1 else float(value)
+        return value
+    
+    def _chunks(self, term, var, start, end):
+        """Yield term values over start..end in chunks (NumPy arrays when possible)"""
+        code = _compile_expression(term, "<series>")
+        builtins = {"__builtins__": {}}
+        if np is not None:
+            vector_names = ChainMap({}, self.VECTOR_FUNCTIONS, self.namespace)
+            for lo in range(start, end + 1, self.CHUNK):
+                hi = min(lo + self.CHUNK, end + 1)
+                vector_names.maps[0][var] = np.arange(lo, hi, dtype=np.float64)
+                try:
+                    with np.errstate(all="ignore"):
+                        values = eval(code, builtins, vector_names)
+                    values = np.broadcast_to(np.asarray(values, dtype=np.float64), (hi - lo,))
+                except Exception:
+                    break  # not vectorizable; evaluate the rest term by term
+                bad = np.flatnonzero(~np.isfinite(values))
+                if len(bad):
+                    raise ValueError(f"Cannot evaluate term at {var} = {lo + bad[0]}: "
+                                     f"{values[bad[0]]}")
+                yield values
+            else:
+                return
+            start = lo
+        
+        # Nested series terms may refer to this series' variable
+        names = self.extend_namespace(ChainMap({}, self.namespace))
+        for lo in range(start, end + 1, self.CHUNK):
+            values = []
+            for n in range(lo, min(lo + self.CHUNK, end + 1)):
+                names.maps[0][var] = n
+                try:
+                    value = float(eval(code, builtins, names))
+                except Exception as e:
+                    raise ValueError(f"Cannot evaluate term at {var} = {n}: {e}") from None
+                if not math.isfinite(value):
+                    raise ValueError(f"Cannot evaluate term at {var} = {n}: {value}")
+                values.append(value)
+            yield np.array(values) if np is not None else values
+    
+    # Closed forms
+    
+    def _constant(self, node, var):
+        """Numeric value of a subtree that doesn't involve var, else None"""
+        if var in self.free_names(ast.Expression(node)):
+            return None
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            value = node.value
+        else:
+            try:
+                code = compile(ast.Expression(node), "<series>", "eval")
+                value = eval(code, {"__builtins__": {}}, self.namespace)
+            except Exception:
+                return None
+        if isinstance(value, bool) or not isinstance(value, (int, float, Fraction)):
+            return None
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        return Fraction(value)
+    
+    def _polynomial(self, node, var):
+        """Coefficients [c0, c1, ...] (Fractions) if node is a polynomial in var"""
+        constant = self._constant(node, var)
+        if constant is not None:
+            return [constant]
+        if isinstance(node, ast.Name) and node.id == var:
+            return [Fraction(0), Fraction(1)]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            inner = self._polynomial(node.operand, var)
+            if inner is None:
+                return None
+            return [-c for c in inner] if isinstance(node.op, ast.USub) else inner
+        if not isinstance(node, ast.BinOp):
+            return None
+        
+        left = self._polynomial(node.left, var)
+        if left is None:
+            return None
+        if isinstance(node.op, ast.Pow):
+            exponent = self._constant(node.right, var)
+            if exponent is None or exponent.denominator != 1 or not 0 <= exponent:
+                return None
+            if (len(left) - 1) * exponent > self.MAX_DEGREE:
+                return None
+            result = [Fraction(1)]
+            for _ in range(int(exponent)):
+                result = self._multiply(result, left)
+            return result
+        if isinstance(node.op, ast.Div):
+            divisor = self._constant(node.right, var)
+            if not divisor:
+                return None
+            return [c / divisor for c in left]
+        
+        right = self._polynomial(node.right, var)
+        if right is None:
+            return None
+        if isinstance(node.op, (ast.Add, ast.Sub)):
+            sign = 1 if isinstance(node.op, ast.Add) else -1
+            size = max(len(left), len(right))
+            left += [Fraction(0)] * (size - len(left))
+            right += [Fraction(0)] * (size - len(right))
+            return [a + sign * b for a, b in zip(left, right)]
+        if isinstance(node.op, ast.Mult):
+            if len(left) + len(right) - 2 > self.MAX_DEGREE:
+                return None
+            return self._multiply(left, right)
+        return None
+    
+    @staticmethod
+    def _multiply(p, q):
+        result = [Fraction(0)] * (len(p) + len(q) - 1)
+        for i, a in enumerate(p):
+            for j, b in enumerate(q):
+                result[i + j] += a * b
+        return result
+    
+    @staticmethod
+    def _polynomial_sum(coefficients, start, end):
+        """Exact Σ p(n) for n = start..end via Newton forward differences"""
+        degree = len(coefficients) - 1
+        values = [sum(c * (start + j) ** i for i, c in enumerate(coefficients))
+                  for j in range(degree + 1)]
+        # Σ_{j=0}^{m} q(j) = Σ_i Δ^i q(0) * C(m + 1, i + 1)
+        m = end - start
+        total = Fraction(0)
+        for i in range(degree + 1):
+            total += values[0] * math.comb(m + 1, i + 1)
+            values = [b - a for a, b in zip(values, values[1:])]
+        return total
+    
+    def _exponential(self, node, var):
+        """(coefficient, base, slope, intercept) if node is c * base ** (slope*var + intercept)"""
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            base = self._constant(node.left, var)
+            exponent = self._polynomial(node.right, var)
+            if base is None or base <= 0 or exponent is None or len(exponent) != 2:
+                return None
+            return Fraction(1), float(base), exponent[1], exponent[0]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            inner = self._exponential(node.operand, var)
+            return inner and (-inner[0],) + inner[1:]
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Mult, ast.Div)):
+            constant = self._constant(node.right, var)
+            other = node.left
+            if constant is None and isinstance(node.op, ast.Mult):
+                constant, other = self._constant(node.left, var), node.right
+            if not constant:
+                return None
+            inner = self._exponential(other, var)
+            if inner is None:
+                return None
+            factor = constant if isinstance(node.op, ast.Mult) else 1 / constant
+            return (inner[0] * factor,) + inner[1:]
+        return None
+    
+    def _geometric_sum(self, coefficient, base, slope, intercept, start, end):
+        ratio = base ** float(slope)
+        scale = float(coefficient) * base ** float(intercept)
+        count = end - start + 1
+        if ratio == 1:
+            return scale * count
+        return scale * ratio ** start * (ratio ** count - 1) / (ratio - 1)
+
+
+class Workspace:
+    """User variables and functions kept in a dependency graph
+    
+    Definitions look like `r = 3` or `area(r) = pi*r**2`. Values are memoized;
+    redefining a name recomputes only the names that depend on it, in
+    topological order. User functions memoize their results per arguments.
+    """
+    
+    DEFINITION = re.compile(r"^\s*([A-Za-z_]\w*)\s*(?:\(([^)]*)\))?\s*=(?!=)(.+)$")
+    FUNCTION_CACHE_SIZE = 1024
+    
+    def __init__(self, engine=None):
+        self.engine = engine or MathEngine()
+        self.definitions = {}   # name -> (params or None, expression)
+        self.dependencies = {}  # name -> names it references
+        self.dependents = {}    # name -> names referencing it
+        self.values = {}        # memoized variable values and function callables
+        self.errors = {}        # name -> error message for names that failed
+        self.namespace = SeriesEvaluator.extend_namespace(dict(MathEngine.NAMESPACE))
+    
+    def is_definition(self, text):
+        return self.DEFINITION.match(text) is not None
+    
+    def define(self, statement):
+        """Add or replace a definition; returns the names recomputed, in order"""
+        match = self.DEFINITION.match(statement)
+        if not match:
+            raise ValueError(f"Not a definition: {statement!r}")
+        name, params, expression = match.groups()
+        if params is not None:
+            params = tuple(p.strip() for p in params.split(",") if p.strip())
+            if not all(p.isidentifier() for p in params):
+                raise ValueError(f"Invalid parameter list: {match.group(2)!r}")
+        return self.set(name, expression.strip(), params)
+    
+    def set(self, name, expression, params=None):
+        """Define name as a variable (params None) or a function of params"""
+        if name in MathEngine.NAMESPACE or name in SeriesEvaluator.FUNCTIONS:
+            raise ValueError(f"Cannot redefine built-in name: {name}")
+        try:
+            tree = ast.parse(self.engine.translate(expression), mode="eval")
+        except SyntaxError as e:
+            raise ValueError(f"Invalid expression: {e}") from None
+        _check_expression(tree)
+        references = SeriesEvaluator.free_names(tree)
+        references -= set(params or ()) | set(MathEngine.NAMESPACE) | set(SeriesEvaluator.FUNCTIONS)
+        
+        if name in references or any(name in self._upstream(r) for r in references):
+            raise ValueError(f"Circular definition: {name}")
+        
+        for old in self.dependencies.get(name, ()):
+            self.dependents[old].discard(name)
+        for reference in references:
+            self.dependents.setdefault(reference, set()).add(name)
+        self.dependencies[name] = references
+        self.definitions[name] = (params, expression)
+        return self._recompute(name)
+    
+    def remove(self, name):
+        """Delete a definition; dependents are recomputed (and become errors)"""
+        if name not in self.definitions:
+            raise KeyError(name)
+        for reference in self.dependencies.pop(name):
+            self.dependents[reference].discard(name)
+        del self.definitions[name]
+        return self._recompute(name)
+    
+    def evaluate(self, expression):
+        """Evaluate an expression with user variables and functions in scope"""
+        return self.engine.evaluate(expression, self.namespace)
+    
+    def _upstream(self, name):
+        """All names that name depends on, transitively"""
+        seen, stack = set(), [name]
+        while stack:
+            for reference in self.dependencies.get(stack.pop(), ()):
+                if reference not in seen:
+                    seen.add(reference)
+                    stack.append(reference)
+        return seen
+    
+    def _recompute(self, name):
+        """Recompute name and everything downstream of it"""
+        affected, stack = {name}, [name]
+        while stack:
+            for dependent in self.dependents.get(stack.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    stack.append(dependent)
+        
+        # Kahn's algorithm over the affected subgraph
+        pending = {n: len(self.dependencies.get(n, set()) & affected) for n in affected}
+        ready = [n for n, count in pending.items() if count == 0]
+        order = []
+        while ready:
+            current = ready.pop()
+            order.append(current)
+            for dependent in self.dependents.get(current, ()):
+                if dependent in pending:
+                    pending[dependent] -= 1
+                    if pending[dependent] == 0:
+                        ready.append(dependent)
+        
+        for current in order:
+            self._evaluate_definition(current)
+        return [n for n in order if n in self.definitions]
+    
+    def _evaluate_definition(self, name):
+        self.values.pop(name, None)
+        self.errors.pop(name, None)
+        self.namespace.pop(name, None)
+        if name not in self.definitions:
+            return
+        
+        params, expression = self.definitions[name]
+        missing = [r for r in self.dependencies[name] if r not in self.namespace]
+        if missing:
+            self.errors[name] = f"Undefined: {', '.join(sorted(missing))}"
+            return
+        try:
+            code = self.engine._compile(expression)
+            if params is None:
+                value = eval(code, {"__builtins__": {}}, self.namespace)
+            else:
+                value = self._make_function(name, params, code)
+        except Exception as e:
+            self.errors[name] = str(e)
+            return
+        self.values[name] = value
+        self.namespace[name] = value
+    
+    def _make_function(self, name, params, code):
+        namespace = self.namespace
+        builtins = {"__builtins__": {}}
+        
+        @lru_cache(maxsize=self.FUNCTION_CACHE_SIZE)
+        def function(*args):
+            if len(args) != len(params):
+                raise TypeError(f"{name}() takes {len(params)} arguments, got {len(args)}")
+            # Series in the body need to see the parameters too
+            scope = SeriesEvaluator.extend_namespace(ChainMap(dict(zip(params, args)), namespace))
+            return eval(code, builtins, scope)
+        function.__name__ = name
+        return function
+    
+    def describe(self, name):
+        """Human-readable 'definition = value' line for the variables list"""
+        params, expression = self.definitions[name]
+        label = f"{name}({', '.join(params)})" if params is not None else name
+        if name in self.errors:
+            return f"{label} = {expression}  [{self.errors[name]}]"
+        if params is not None:
+            return f"{label} = {expression}"
+        return f"{label} = {self.values[name]}"
+
+
 class ConversionService:
     """Handles unit conversions for various categories"""
     
@@ -158,59 +900,1351 @@ class ConversionService:
             return celsius + 273.15
 
 
+def _shift_count(count):
+    """Validate a shift count; anything past 64 bits shifts everything out"""
+    if count < 0:
+        raise ValueError("Negative shift count")
+    return min(count, 64)
+
+
+def _truncating_div(a, b):
+    """Integer division rounding toward zero, as in C"""
+    if b == 0:
+        raise ValueError("Division by zero")
+    q = abs(a) // abs(b)
+    return -q if (a < 0) != (b < 0) else q
+
+
+def _truncating_mod(a, b):
+    """Remainder matching _truncating_div"""
+    return a - b * _truncating_div(a, b)
+
+
 class ProgrammerCalculator:
     """Handles programmer mode operations"""
     
+    WORD_SIZES = {"QWORD": 64, "DWORD": 32, "WORD": 16, "BYTE": 8}
+    BASE_FORMATS = {2: "b", 8: "o", 10: "d", 16: "X"}
+    _MASKS = {bits: (1 << bits, (1 << bits) - 1, 1 << (bits - 1))
+              for bits in WORD_SIZES.values()}
+    _BITWISE_OPS = {
+        "AND": operator.and_,
+        "OR": operator.or_,
+        "XOR": operator.xor,
+        "NOT": lambda x, y: ~x,
+        "<<": lambda x, y: x << y,
+        ">>": lambda x, y: x >> y
+    }
+    _UNARY_OPS = {"neg": operator.neg, "~": operator.invert}
+    _BINARY_OPS = {
+        "+": operator.add, "-": operator.sub, "*": operator.mul,
+        "/": _truncating_div, "%": _truncating_mod,
+        "<<": lambda a, b: a << _shift_count(b),
+        ">>": lambda a, b: a >> _shift_count(b),
+        "&": operator.and_, "|": operator.or_, "^": operator.xor
+    }
+    
     def __init__(self):
         self.word_size = 64  # QWORD by default
         self.signed = True
+    
+    @property
+    def word_size(self):
+        return self._word_size
+    
+    @word_size.setter
+    def word_size(self, bits):
+        # Masks are precomputed per word size so hot paths never recompute 2 ** bits
+        try:
+            masks = self._MASKS[bits]
+        except (KeyError, TypeError):
+            raise ValueError(f"Unsupported word size: {bits}") from None
+        self._word_size = bits
+        self.modulus, self.mask, self.sign_bit = masks
         
     def convert_base(self, value, from_base, to_base):
         """Convert number between bases (2, 8, 10, 16)"""
+        if to_base not in self.BASE_FORMATS:
+            raise ValueError(f"Unsupported base: {to_base}")
         try:
             # Convert to decimal
             if isinstance(value, str):
                 decimal_value = int(value, from_base)
             else:
                 decimal_value = int(value)
-            
-            # Handle word size limits
-            max_val = 2 ** self.word_size
-            decimal_value = decimal_value % max_val
-            
-            # Convert to target base
-            if to_base == 2:
-                return bin(decimal_value)[2:]
-            elif to_base == 8:
-                return oct(decimal_value)[2:]
-            elif to_base == 10:
-                return str(decimal_value)
-            elif to_base == 16:
-                return hex(decimal_value)[2:].upper()
-        except:
-            return "0"
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid base-{from_base} value: {value!r}") from e
+        
+        # Masking handles word size limits (and negatives as two's complement)
+        return format(decimal_value & self.mask, self.BASE_FORMATS[to_base])
+    
+    def convert_many(self, values, from_base, to_base):
+        """Convert a sequence of values between bases in one pass"""
+        if to_base not in self.BASE_FORMATS:
+            raise ValueError(f"Unsupported base: {to_base}")
+        spec = self.BASE_FORMATS[to_base]
+        mask = self.mask
+        try:
+            if from_base == 10 or not values or not isinstance(values[0], str):
+                return [format(int(v) & mask, spec) for v in values]
+            return [format(int(v, from_base) & mask, spec) for v in values]
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid base-{from_base} value in batch: {e}") from e
     
     def bitwise_operation(self, a, b, operation):
         """Perform bitwise operations"""
-        operations = {
-            "AND": lambda x, y: x & y,
-            "OR": lambda x, y: x | y,
-            "XOR": lambda x, y: x ^ y,
-            "NOT": lambda x, y: ~x,
-            "<<": lambda x, y: x << y,
-            ">>": lambda x, y: x >> y
-        }
-        
-        result = operations[operation](int(a), int(b) if b else 0)
+        result = self._BITWISE_OPS[operation](int(a), int(b) if b else 0)
         
         # Handle word size
-        max_val = 2 ** self.word_size
-        return result % max_val
+        return result & self.mask
+    
+    def wrap(self, value):
+        """Reduce an integer to the current word size, honouring the signed flag"""
+        value &= self.mask
+        if self.signed and value & self.sign_bit:
+            value -= self.modulus
+        return value
+    
+    def format_value(self, value, base):
+        """Format a value for display: signed decimal, two's complement otherwise"""
+        if base == 10:
+            return str(self.wrap(value))
+        return format(value & self.mask, self.BASE_FORMATS[base])
+    
+    @PERF.timed("programmer.evaluate")
+    def evaluate(self, expression, base=10):
+        """Evaluate an integer expression with C-like precedence
+        
+        Supports + - * / % (truncating), << >>, AND/&, OR/|, XOR/^, NOT/~,
+        unary minus and parentheses. Every intermediate result is wrapped to
+        the current word size.
+        """
+        return self._run(_compile_int_expression(expression, base))
+    
+    def evaluate_many(self, expressions, base=10):
+        """Evaluate many expressions; invalid entries give None instead of raising
+        
+        Batches are mostly distinct expressions, so the parse cache is bypassed
+        rather than churned.
+        """
+        run = self._run
+        compile_expression = _compile_int_expression.__wrapped__
+        results = []
+        append = results.append
+        for expression in expressions:
+            try:
+                append(run(compile_expression(expression, base)))
+            except ValueError:
+                append(None)
+        return results
+    
+    def _run(self, program):
+        """Execute a compiled RPN program"""
+        stack = []
+        push, pop = stack.append, stack.pop
+        # wrap() inlined: this loop is the per-token hot path of evaluate_many
+        mask, modulus = self.mask, self.modulus
+        sign_bit = self.sign_bit if self.signed else 0
+        unary, binary = self._UNARY_OPS, self._BINARY_OPS
+        for item in program:
+            if item.__class__ is int:
+                value = item & mask
+            elif item in unary:
+                value = unary[item](pop()) & mask
+            else:
+                b = pop()
+                value = binary[item](pop(), b) & mask
+            push(value - modulus if value & sign_bit else value)
+        return stack[0]
+
+
+# Precedence follows C: | < ^ < & < shifts < additive < multiplicative < unary
+_INT_PRECEDENCE = {"|": 1, "^": 2, "&": 3, "<<": 4, ">>": 4,
+                   "+": 5, "-": 5, "*": 6, "/": 6, "%": 6, "neg": 7, "~": 7}
+_INT_ALIASES = {"AND": "&", "OR": "|", "XOR": "^", "NOT": "~", "×": "*", "÷": "/"}
+# The last group catches anything else, so findall() covers the whole input
+_INT_TOKEN = re.compile(r"\s*(?:(AND|OR|XOR|NOT)\b|(<<|>>|[-+*/%&|^~()×÷])|([0-9A-Fa-f]+)|(\S))")
+
+
+@lru_cache(maxsize=4096)
+def _compile_int_expression(expression, base):
+    """Parse an integer expression into an RPN tuple (shunting-yard)"""
+    output, ops = [], []
+    expect_operand = True
+    for keyword, symbol, number, other in _INT_TOKEN.findall(expression):
+        if other:
+            raise ValueError(f"Unexpected input: {other!r}")
+        token = keyword or symbol
+        token = _INT_ALIASES.get(token, token)
+        
+        if number:
+            if not expect_operand:
+                raise ValueError(f"Missing operator before {number!r}")
+            try:
+                output.append(int(number, base))
+            except ValueError:
+                raise ValueError(f"Invalid base-{base} number: {number!r}") from None
+            expect_operand = False
+        elif token == "(":
+            if not expect_operand:
+                raise ValueError("Missing operator before '('")
+            ops.append(token)
+        elif token == ")":
+            while ops and ops[-1] != "(":
+                output.append(ops.pop())
+            if not ops or expect_operand:
+                raise ValueError("Mismatched parentheses")
+            ops.pop()
+        elif expect_operand:
+            # Prefix operators: unary minus/plus and NOT
+            if token == "-":
+                ops.append("neg")
+            elif token == "~":
+                ops.append("~")
+            elif token != "+":
+                raise ValueError(f"Missing operand before {token!r}")
+        else:
+            if token == "~":
+                raise ValueError("NOT is a prefix operator")
+            precedence = _INT_PRECEDENCE[token]
+            while ops and ops[-1] != "(" and _INT_PRECEDENCE[ops[-1]] >= precedence:
+                output.append(ops.pop())
+            ops.append(token)
+            expect_operand = True
+    
+    if expect_operand:
+        raise ValueError("Incomplete expression")
+    while ops:
+        if ops[-1] == "(":
+            raise ValueError("Mismatched parentheses")
+        output.append(ops.pop())
+    return tuple(output)
+
+
+PERF.register_cache("programmer.compile", _compile_int_expression)
+
+
+class BinaryDumpView:
+    """Read-only hex/oct/bin/dec view of a file, formatted from a memory map
+    
+    Rows are decoded from zero-copy slices of the mapping, so only the rows
+    being displayed are ever read, regardless of file size.
+    """
+    
+    BYTES_PER_ROW = 16
+    _STRUCT_CODES = {8: "B", 16: "H", 32: "I", 64: "Q"}
+    
+    def __init__(self, path, word_size=8, endian="little", base=16):
+        self.path = path
+        self._file = open(path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        if self.size == 0:
+            self._file.close()
+            raise ValueError(f"Cannot view empty file: {path}")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self.configure(word_size, endian, base)
+    
+    def configure(self, word_size=None, endian=None, base=None):
+        """Change the word size (bits), endianness or display base"""
+        if word_size is not None:
+            if word_size not in self._STRUCT_CODES:
+                raise ValueError(f"Unsupported word size: {word_size}")
+            self.word_size = word_size
+        if endian is not None:
+            if endian not in ("little", "big"):
+                raise ValueError(f"Unsupported endianness: {endian}")
+            self.endian = endian
+        if base is not None:
+            if base not in ProgrammerCalculator.BASE_FORMATS:
+                raise ValueError(f"Unsupported base: {base}")
+            self.base = base
+        
+        self.word_bytes = self.word_size // 8
+        prefix = "<" if self.endian == "little" else ">"
+        self._struct = struct.Struct(prefix + self._STRUCT_CODES[self.word_size])
+        spec = ProgrammerCalculator.BASE_FORMATS[self.base]
+        width = len(format((1 << self.word_size) - 1, spec))
+        self._word_format = f"{{:0{width}{spec}}}"
+    
+    @property
+    def row_count(self):
+        return -(-self.size // self.BYTES_PER_ROW)
+    
+    def words(self, offset, count):
+        """Decode count whole words starting at a byte offset"""
+        end = min(offset + count * self.word_bytes, self.size)
+        end -= (end - offset) % self.word_bytes
+        chunk = self._view[offset:end]
+        try:
+            return [w for (w,) in self._struct.iter_unpack(chunk)]
+        finally:
+            chunk.release()
+    
+    def rows(self, first_row, count):
+        """Format count rows starting at first_row as 'offset: words' lines"""
+        lines = []
+        fmt = self._word_format
+        for row in range(first_row, min(first_row + count, self.row_count)):
+            offset = row * self.BYTES_PER_ROW
+            words = self.words(offset, self.BYTES_PER_ROW // self.word_bytes)
+            cells = [fmt.format(w) for w in words]
+            # Trailing bytes that don't fill a whole word are shown zero-padded
+            tail = offset + len(words) * self.word_bytes
+            row_end = min(offset + self.BYTES_PER_ROW, self.size)
+            if tail < row_end:
+                padded = bytes(self._view[tail:row_end]).ljust(self.word_bytes, b"\0")
+                cells.append(fmt.format(int.from_bytes(padded, self.endian)))
+            lines.append(f"{offset:012X}: " + " ".join(cells))
+        return lines
+    
+    def close(self):
+        """Release the memory map and file handle"""
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+
+class GraphEngine:
+    """Evaluates graphing-mode equations in x and samples them onto a canvas grid"""
+    
+    SCALE = 20  # pixels per unit
+    NAMESPACE = {"sin": math.sin, "cos": math.cos, "tan": math.tan,
+                 "sqrt": math.sqrt, "exp": math.exp, "log": math.log,
+                 "abs": abs, "pi": math.pi, "e": math.e}
+    if np is not None:
+        VECTOR_NAMESPACE = {"sin": np.sin, "cos": np.cos, "tan": np.tan,
+                            "sqrt": np.sqrt, "exp": np.exp, "log": np.log,
+                            "abs": np.abs, "pi": math.pi, "e": math.e}
+    
+    def __init__(self):
+        # (equation, xs, ys) from the most recent sample(), reused by GraphAnalyzer
+        self.last_samples = None
+    
+    def compile(self, equation):
+        """Compile an equation once and return it as a function of x"""
+        code = _compile_expression(equation, "<equation>")
+        names = dict(self.NAMESPACE)
+        builtins = {"__builtins__": {}}
+        
+        def f(x):
+            names["x"] = x
+            return eval(code, builtins, names)
+        return f
+    
+    def evaluate_many(self, equation, xs):
+        """Evaluate the equation at many x values; failures give NaN
+        
+        Evaluates the whole array at once with NumPy when available, falling
+        back to one call per point for equations that don't vectorize.
+        """
+        code = _compile_expression(equation, "<equation>")
+        if np is not None:
+            xs = np.asarray(xs, dtype=np.float64)
+            try:
+                with np.errstate(all="ignore"):
+                    ys = eval(code, {"__builtins__": {}}, dict(self.VECTOR_NAMESPACE, x=xs))
+                ys = np.broadcast_to(np.asarray(ys, dtype=np.float64), xs.shape)
+                return np.where(np.isfinite(ys), ys, np.nan)
+            except Exception:
+                pass
+        
+        f = self.compile(equation)
+        ys = []
+        for x in xs:
+            try:
+                y = float(f(float(x)))
+                ys.append(y if math.isfinite(y) else math.nan)
+            except Exception:
+                ys.append(math.nan)
+        return np.array(ys) if np is not None else ys
+    
+    @PERF.timed("plot.sample")
+    def sample(self, equation, width, height, scale_x=SCALE, scale_y=SCALE):
+        """Evaluate the equation once per pixel column, returning in-bounds canvas points"""
+        center_x = width // 2
+        center_y = height // 2
+        xs = [(pixel_x - center_x) / scale_x for pixel_x in range(width)]
+        ys = self.evaluate_many(equation, xs)
+        self.last_samples = (equation, xs, ys)
+        
+        points = []
+        for pixel_x, y in enumerate(ys if np is None else ys.tolist()):
+            # Convert to canvas coordinates
+            pixel_y = center_y - (y * scale_y)
+            
+            # Only plot if within canvas bounds (NaN never is)
+            if 0 <= pixel_y <= height:
+                points.append((pixel_x, pixel_y))
+        return points
+
+
+class GraphAnalyzer:
+    """Roots, extrema and definite integrals of graphing-mode equations
+    
+    Roots and extrema are bracketed from sampled values (by default the
+    samples of the last plot) and then refined: roots with Brent's method,
+    extrema with golden-section search. Integrals use adaptive Simpson.
+    """
+    
+    XTOL = 1e-12
+    MAX_ITERATIONS = 200
+    
+    def __init__(self, engine):
+        self.engine = engine
+    
+    def _samples(self, equation, xs, ys):
+        if xs is None:
+            last = self.engine.last_samples
+            if last is None or last[0] != equation:
+                raise ValueError("Plot the equation first or pass sample points")
+            _, xs, ys = last
+        elif ys is None:
+            ys = self.engine.evaluate_many(equation, xs)
+        return list(xs), [float(y) for y in ys]
+    
+    def roots(self, equation, xs=None, ys=None):
+        """Find roots between sample points where the sign changes"""
+        xs, ys = self._samples(equation, xs, ys)
+        f = self._safe(self.engine.compile(equation))
+        roots = []
+        for i in self._sign_changes(ys):
+            a, b, fa, fb = xs[i], xs[i + 1], ys[i], ys[i + 1]
+            if fa == 0:
+                root = a
+            elif fb == 0:
+                continue  # picked up as the left end of the next interval
+            else:
+                root = self._brent(f, a, b, fa, fb)
+                # Sign changes across poles (e.g. tan) refine to huge values, not zeros
+                if not abs(f(root)) <= max(abs(fa), abs(fb)):
+                    continue
+            if not roots or abs(root - roots[-1]) > 1e-9:
+                roots.append(root)
+        if ys and ys[-1] == 0 and (not roots or roots[-1] != xs[-1]):
+            roots.append(xs[-1])
+        return roots
+    
+    def extrema(self, equation, xs=None, ys=None):
+        """Find local minima and maxima as (x, y, kind) tuples"""
+        xs, ys = self._samples(equation, xs, ys)
+        f = self._safe(self.engine.compile(equation))
+        results = []
+        for i, kind in self._turning_points(ys):
+            sign = 1 if kind == "min" else -1
+            x = self._golden(lambda t: sign * f(t), xs[i - 1], xs[i + 1])
+            y = f(x)
+            # A smooth extremum refines by less than the neighbouring sample steps;
+            # turning points next to poles (e.g. tan) run off instead
+            step = max(abs(ys[i] - ys[i - 1]), abs(ys[i + 1] - ys[i]))
+            if abs(y - ys[i]) <= step:
+                results.append((x, y, kind))
+        return results
+    
+    def integrate(self, equation, a, b, tol=1e-10, rel_tol=1e-10, max_depth=50,
+                  max_evaluations=100000):
+        """Definite integral from a to b by adaptive Simpson quadrature
+        
+        Each interval is accepted once its error is within the larger of its
+        share of tol and rel_tol times its own estimate. Refinement stops after
+        max_evaluations function calls, so large or badly behaved integrals
+        still return promptly.
+        """
+        f = self.engine.compile(equation)
+        if a == b:
+            return 0.0
+        try:
+            fa, fb, m = f(a), f(b), (a + b) / 2
+            fm = f(m)
+            whole = (b - a) / 6 * (fa + 4 * fm + fb)
+            # Below ~1e-15 * |integral| the error is rounding and never shrinks
+            tol = max(tol, 1e-15 * abs(whole))
+            budget = [max_evaluations - 3]
+            result = self._simpson(f, a, b, fa, fm, fb, whole, tol, rel_tol, max_depth, budget)
+        except (ArithmeticError, ValueError, TypeError) as e:
+            raise ValueError(f"Cannot integrate: {e}") from None
+        if not math.isfinite(result):
+            raise ValueError("Integral does not converge")
+        return result
+    
+    @staticmethod
+    def _safe(f):
+        def wrapped(x):
+            try:
+                y = float(f(x))
+            except Exception:
+                return math.nan
+            return y
+        return wrapped
+    
+    @staticmethod
+    def _sign_changes(ys):
+        """Indices i where ys changes sign (or hits zero) between i and i + 1"""
+        if np is not None:
+            y = np.asarray(ys, dtype=np.float64)
+            with np.errstate(invalid="ignore"):
+                mask = (y[:-1] * y[1:] <= 0) & np.isfinite(y[:-1]) & np.isfinite(y[1:])
+            return np.nonzero(mask)[0].tolist()
+        return [i for i in range(len(ys) - 1) if ys[i] * ys[i + 1] <= 0]
+    
+    @staticmethod
+    def _turning_points(ys):
+        """Interior sample indices where the slope changes sign, with min/max kind"""
+        if np is not None:
+            y = np.asarray(ys, dtype=np.float64)
+            d = np.diff(y)
+            with np.errstate(invalid="ignore"):
+                minima = (d[:-1] < 0) & (d[1:] >= 0)
+                maxima = (d[:-1] > 0) & (d[1:] <= 0)
+            points = [(i + 1, "min") for i in np.nonzero(minima)[0].tolist()]
+            points += [(i + 1, "max") for i in np.nonzero(maxima)[0].tolist()]
+            return sorted(points)
+        points = []
+        for i in range(1, len(ys) - 1):
+            left, right = ys[i] - ys[i - 1], ys[i + 1] - ys[i]
+            if left < 0 <= right:
+                points.append((i, "min"))
+            elif left > 0 >= right:
+                points.append((i, "max"))
+        return points
+    
+    def _brent(self, f, a, b, fa, fb):
+        """Brent's method for a root in [a, b] given f(a) and f(b) of opposite sign"""
+        if abs(fa) < abs(fb):
+            a, b, fa, fb = b, a, fb, fa
+        c, fc, d = a, fa, b - a
+        bisected = True
+        for _ in range(self.MAX_ITERATIONS):
+            if fb == 0 or abs(b - a) < self.XTOL:
+                break
+            if fa != fc and fb != fc:
+                # Inverse quadratic interpolation
+                s = (a * fb * fc / ((fa - fb) * (fa - fc))
+                     + b * fa * fc / ((fb - fa) * (fb - fc))
+                     + c * fa * fb / ((fc - fa) * (fc - fb)))
+            else:
+                s = b - fb * (b - a) / (fb - fa)  # secant
+            
+            lo, hi = sorted(((3 * a + b) / 4, b))
+            if (not lo < s < hi
+                    or (bisected and abs(s - b) >= abs(b - c) / 2)
+                    or (not bisected and abs(s - b) >= abs(c - d) / 2)):
+                s = (a + b) / 2
+                bisected = True
+            else:
+                bisected = False
+            
+            fs = f(s)
+            if math.isnan(fs):
+                s, fs = (a + b) / 2, f((a + b) / 2)
+            d, c, fc = c, b, fb
+            if fa * fs < 0:
+                b, fb = s, fs
+            else:
+                a, fa = s, fs
+            if abs(fa) < abs(fb):
+                a, b, fa, fb = b, a, fb, fa
+        return b
+    
+    def _golden(self, f, a, b):
+        """Golden-section search for a minimum of f in [a, b]"""
+        ratio = (math.sqrt(5) - 1) / 2
+        c, d = b - ratio * (b - a), a + ratio * (b - a)
+        fc, fd = f(c), f(d)
+        for _ in range(self.MAX_ITERATIONS):
+            if abs(b - a) < 1e-10:
+                break
+            if fc < fd:
+                b, d, fd = d, c, fc
+                c = b - ratio * (b - a)
+                fc = f(c)
+            else:
+                a, c, fc = c, d, fd
+                d = a + ratio * (b - a)
+                fd = f(d)
+        return (a + b) / 2
+    
+    def _simpson(self, f, a, b, fa, fm, fb, whole, tol, rel_tol, depth, budget):
+        m = (a + b) / 2
+        lm, rm = (a + m) / 2, (m + b) / 2
+        flm, frm = f(lm), f(rm)
+        budget[0] -= 2
+        left = (m - a) / 6 * (fa + 4 * flm + fm)
+        right = (b - m) / 6 * (fm + 4 * frm + fb)
+        delta = left + right - whole
+        if (depth <= 0 or budget[0] <= 0
+                or abs(delta) <= 15 * max(tol, rel_tol * abs(left + right))):
+            return left + right + delta / 15
+        return (self._simpson(f, a, m, fa, flm, fm, left, tol / 2, rel_tol, depth - 1, budget)
+                + self._simpson(f, m, b, fm, frm, fb, right, tol / 2, rel_tol, depth - 1, budget))
+
+
+class ValueTable:
+    """Lazily computed (x, f(x)) rows of an equation over start..stop by step
+    
+    Rows are evaluated in chunks on first access and a bounded number of
+    chunks is kept, so huge ranges cost only what is actually viewed.
+    """
+    
+    CHUNK_ROWS = 4096
+    MAX_CACHED_CHUNKS = 64
+    
+    def __init__(self, engine, equation, start, stop, step):
+        if not all(math.isfinite(v) for v in (start, stop, step)):
+            raise ValueError("From, To and Step must be finite numbers")
+        if step == 0 or (stop - start) * step < 0:
+            raise ValueError("Step must be non-zero and point from start to stop")
+        _compile_expression(equation, "<equation>")  # fail early on bad input
+        self.engine = engine
+        self.equation = equation
+        self.start, self.stop, self.step = start, stop, step
+        steps = (stop - start) / step
+        if not steps < sys.maxsize:  # also catches inf from overflowing finite bounds
+            raise ValueError("Range has too many rows")
+        # Small tolerance so e.g. 0..1 by 0.1 includes 1
+        self.row_count = int(math.floor(steps + 1e-9)) + 1
+        self._chunks = OrderedDict()
+    
+    def __len__(self):
+        return self.row_count
+    
+    def rows(self, first, count):
+        """Return up to count (x, y) rows starting at row first"""
+        first = max(first, 0)
+        last = min(first + count, self.row_count)
+        rows = []
+        while first < last:
+            index, offset = divmod(first, self.CHUNK_ROWS)
+            xs, ys = self._chunk(index)
+            take = min(last - first, len(xs) - offset)
+            rows.extend(zip(xs[offset:offset + take], ys[offset:offset + take]))
+            first += take
+        return rows
+    
+    def export_csv(self, path):
+        """Stream every row to a CSV file chunk by chunk; returns rows written"""
+        with open(path, "w", newline="") as f:
+            f.write("x,f(x)\n")
+            for index in range(-(-self.row_count // self.CHUNK_ROWS)):
+                # Computed directly so exporting doesn't evict the cache being viewed
+                xs, ys = self._compute(index)
+                f.write("\n".join(f"{x!r},{'' if y != y else repr(y)}" for x, y in zip(xs, ys)))
+                f.write("\n")
+        return self.row_count
+    
+    def _chunk(self, index):
+        chunk = self._chunks.get(index)
+        if chunk is not None:
+            self._chunks.move_to_end(index)
+            PERF.cache_hit("table.chunks")
+            return chunk
+        PERF.cache_miss("table.chunks")
+        chunk = self._chunks[index] = self._compute(index)
+        if len(self._chunks) > self.MAX_CACHED_CHUNKS:
+            self._chunks.popitem(last=False)
+        return chunk
+    
+    def _compute(self, index):
+        lo = index * self.CHUNK_ROWS
+        hi = min(lo + self.CHUNK_ROWS, self.row_count)
+        if np is not None:
+            xs = self.start + self.step * np.arange(lo, hi, dtype=np.float64)
+        else:
+            xs = [self.start + self.step * i for i in range(lo, hi)]
+        ys = self.engine.evaluate_many(self.equation, xs)
+        if np is not None:
+            return xs.tolist(), np.asarray(ys).tolist()
+        return xs, ys
+
+
+class MatrixService:
+    """Matrix parsing, loading and linear algebra through NumPy (BLAS/LAPACK)
+    
+    Large inputs are memory-mapped: .npy files directly, CSV files by
+    streaming them into a temporary .npy file in chunks. Temporary files
+    are unlinked as soon as they are mapped where the OS allows it, and
+    otherwise by close() once the matrix is no longer referenced.
+    """
+    
+    CSV_CHUNK_ROWS = 10000
+    PREVIEW_THRESHOLD = 100  # elements shown in full before summarizing
+    
+    def __init__(self):
+        if np is None:
+            raise ImportError("Matrix mode requires NumPy")
+        self._temp_files = []
+        atexit.register(self.close)
+    
+    def parse(self, text):
+        """Parse '1 2; 3 4' (rows split by ';' or newlines, values by spaces or commas)"""
+        rows = [r for r in re.split(r"[;\n]", text) if r.strip()]
+        if not rows:
+            raise ValueError("Empty matrix")
+        try:
+            values = [[float(v) for v in re.split(r"[,\s]+", r.strip())] for r in rows]
+        except ValueError as e:
+            raise ValueError(f"Invalid matrix entry: {e}") from None
+        if len({len(r) for r in values}) != 1:
+            raise ValueError("All rows must have the same number of columns")
+        return np.array(values)
+    
+    def load(self, path):
+        """Load a matrix from .npy (memory-mapped) or CSV (streamed to a memory map)"""
+        if path.lower().endswith(".npy"):
+            return np.load(path, mmap_mode="r")
+        
+        with open(path) as f:
+            lines = (line for line in f if line.strip())
+            first = next(lines, None)
+            if first is None:
+                raise ValueError("Empty matrix")
+            columns = len(first.split(","))
+            rows = 1 + sum(1 for _ in lines)
+        fd, temp_path = tempfile.mkstemp(suffix=".npy")
+        os.close(fd)
+        self._temp_files.append(temp_path)
+        matrix = np.lib.format.open_memmap(temp_path, mode="w+", dtype=np.float64,
+                                           shape=(rows, columns))
+        with open(path) as f:
+            lines = (line for line in f if line.strip())
+            row = 0
+            while row < rows:
+                chunk = np.loadtxt(islice(lines, self.CSV_CHUNK_ROWS), delimiter=",",
+                                   dtype=np.float64, ndmin=2)
+                if not len(chunk):
+                    break
+                matrix[row:row + len(chunk)] = chunk
+                row += len(chunk)
+        matrix.flush()
+        del matrix
+        loaded = np.load(temp_path, mmap_mode="r")
+        # POSIX keeps the mapping valid after unlink and frees the space when it
+        # is dropped; Windows refuses while mapped, so close() retries later
+        self.close()
+        return loaded
+    
+    def close(self):
+        """Remove temporary files from CSV imports that are no longer mapped"""
+        remaining = []
+        for path in self._temp_files:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                remaining.append(path)
+        self._temp_files = remaining
+    
+    def multiply(self, a, b):
+        if a.shape[-1] != b.shape[0]:
+            raise ValueError(f"Cannot multiply {a.shape} by {b.shape}")
+        return np.matmul(a, b)
+    
+    def determinant(self, a):
+        self._require_square(a)
+        sign, logdet = np.linalg.slogdet(a)
+        # slogdet avoids overflow in the LU product; exponentiate when representable
+        return float(sign * math.exp(logdet)) if logdet < 709 else (float(sign), float(logdet))
+    
+    def inverse(self, a):
+        self._require_square(a)
+        try:
+            return np.linalg.inv(a)
+        except np.linalg.LinAlgError as e:
+            raise ValueError(f"Matrix is not invertible: {e}") from None
+    
+    def eigenvalues(self, a):
+        self._require_square(a)
+        if np.allclose(a, a.T):
+            return np.linalg.eigvalsh(a)  # symmetric: faster and real-valued
+        return np.linalg.eigvals(a)
+    
+    def solve(self, a, b):
+        """Solve a @ x = b"""
+        self._require_square(a)
+        if b.shape[0] != a.shape[0]:
+            raise ValueError(f"Right-hand side needs {a.shape[0]} rows, got {b.shape[0]}")
+        try:
+            return np.linalg.solve(a, b)
+        except np.linalg.LinAlgError as e:
+            raise ValueError(f"Cannot solve: {e}") from None
+    
+    def preview(self, value):
+        """Summarized text for a result; large arrays show only corner elements"""
+        if isinstance(value, tuple):
+            sign, logdet = value
+            return f"{'-' if sign < 0 else ''}exp({logdet:.10g})"
+        if not isinstance(value, np.ndarray):
+            return f"{value:.10g}"
+        body = np.array2string(value, threshold=self.PREVIEW_THRESHOLD, edgeitems=3,
+                               precision=6, suppress_small=True, max_line_width=60)
+        return f"{' × '.join(map(str, value.shape))} {value.dtype}\n{body}"
+    
+    @staticmethod
+    def _require_square(a):
+        if a.ndim != 2 or a.shape[0] != a.shape[1]:
+            raise ValueError(f"Matrix must be square, got shape {a.shape}")
+
+
+class QuantileSketch:
+    """Mergeable approximate-quantile sketch (KLL-style compactors)
+    
+    Level h holds items of weight 2**h. A full level is sorted and every
+    other item (random offset) is promoted, so memory stays at about
+    k * log2(n / k) items and rank error at a few percent of n / k.
+    """
+    
+    def __init__(self, k=256, seed=None):
+        self.k = k
+        self.levels = [[]]
+        self._random = random.Random(seed)
+    
+    def add(self, value):
+        self.levels[0].append(value)
+        if len(self.levels[0]) > self.k:
+            self._compress()
+    
+    def extend(self, values):
+        self.levels[0].extend(values)
+        if len(self.levels[0]) > self.k:
+            self._compress()
+    
+    def merge(self, other):
+        """Fold another sketch into this one"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for level, items in zip(self.levels, other.levels):
+            level.extend(items)
+        self._compress()
+    
+    def quantile(self, q):
+        """Approximate value at quantile q in [0, 1]; None when empty"""
+        weighted = sorted((v, 1 << h) for h, level in enumerate(self.levels) for v in level)
+        if not weighted:
+            return None
+        target = q * sum(w for _, w in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+    
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self.k:
+                level.sort()
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                # An odd item stays behind so total weight is preserved
+                keep = [level.pop()] if len(level) % 2 else []
+                self.levels[h + 1].extend(level[self._random.randrange(2)::2])
+                self.levels[h] = keep
+            h += 1
+    
+    def __getstate__(self):
+        return {"k": self.k, "levels": self.levels}
+    
+    def __setstate__(self, state):
+        self.k = state["k"]
+        self.levels = state["levels"]
+        self._random = random.Random()
+
+
+class RunningStats:
+    """One-pass statistics in bounded memory, mergeable across processes
+    
+    Mean and variance use Welford's update (Chan et al. when merging), the
+    sum is Neumaier-compensated, and quantiles come from a QuantileSketch.
+    """
+    
+    _NUMBER_SPLIT = re.compile(r"[,;\s]+")
+    
+    def __init__(self, sketch_k=256):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._sum = 0.0
+        self._compensation = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.skipped = 0
+        self.sketch = QuantileSketch(sketch_k)
+    
+    def add(self, value):
+        value = float(value)
+        if not math.isfinite(value):
+            self.skipped += 1
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self._add_to_sum(value)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.sketch.add(value)
+    
+    def update(self, values):
+        """Add a batch of values (vectorized with NumPy when available)"""
+        if np is None:
+            for value in values:
+                self.add(value)
+            return
+        batch = np.asarray(values, dtype=np.float64).ravel()
+        finite = np.isfinite(batch)
+        if not finite.all():
+            # nan/inf parse as floats but would poison every statistic
+            self.skipped += int(batch.size - finite.sum())
+            batch = batch[finite]
+        if batch.size == 0:
+            return
+        other = RunningStats(self.sketch.k)
+        other.count = int(batch.size)
+        other.mean = float(batch.mean())
+        other._m2 = float(((batch - other.mean) ** 2).sum())
+        other._sum = math.fsum(batch.tolist())
+        other.min, other.max = float(batch.min()), float(batch.max())
+        other.sketch.extend(batch.tolist())
+        self.merge(other)
+    
+    def merge(self, other):
+        """Combine with statistics computed over another part of the data"""
+        if other.count == 0:
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self._add_to_sum(other._sum)
+        self._add_to_sum(other._compensation)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.skipped += other.skipped
+        self.sketch.merge(other.sketch)
+        return self
+    
+    def _add_to_sum(self, value):
+        # Neumaier's variant of Kahan summation
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+    
+    @property
+    def sum(self):
+        return self._sum + self._compensation
+    
+    @property
+    def variance(self):
+        """Sample variance (n - 1 denominator)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    @property
+    def population_variance(self):
+        return self._m2 / self.count if self.count else 0.0
+    
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+    
+    def quantile(self, q):
+        return self.sketch.quantile(q)
+    
+    def summary(self):
+        """Dict of the main statistics"""
+        return {
+            "count": self.count, "sum": self.sum, "mean": self.mean,
+            "variance": self.variance, "stdev": self.stdev,
+            "min": self.min if self.count else None, "max": self.max if self.count else None,
+            "p05": self.quantile(0.05), "median": self.quantile(0.5), "p95": self.quantile(0.95),
+            "skipped": self.skipped
+        }
+    
+    def update_from_text(self, text):
+        """Add every finite number in a block of text; other tokens are counted as skipped"""
+        values = []
+        for token in self._NUMBER_SPLIT.split(text):
+            if token:
+                try:
+                    values.append(float(token))
+                except ValueError:
+                    self.skipped += 1
+        self.update(values)
+    
+    @classmethod
+    def from_file(cls, path, start=0, end=None, chunk_bytes=1 << 22):
+        """Stream numbers from a text file, optionally only the byte range [start, end)
+        
+        Ranges are aligned to line boundaries: a line belongs to the range in
+        which it starts, so adjacent ranges cover each line exactly once.
+        """
+        stats = cls()
+        with open(path, "rb") as f:
+            if start > 0:
+                f.seek(start - 1)
+                f.readline()  # finish the line that started before this range
+            position = f.tell()
+            while end is None or position < end:
+                budget = chunk_bytes if end is None else min(chunk_bytes, end - position)
+                block = f.read(budget)
+                if not block:
+                    break
+                if not block.endswith(b"\n"):
+                    block += f.readline()  # complete the last line
+                position += len(block)
+                stats.update_from_text(block.decode("utf-8", "replace"))
+        return stats
+    
+    @classmethod
+    def from_file_parallel(cls, path, workers=None):
+        """Split a file into byte ranges, process them in worker processes and merge"""
+        workers = workers or os.cpu_count() or 1
+        size = os.path.getsize(path)
+        bounds = [size * i // workers for i in range(workers + 1)]
+        stats = cls()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(cls.from_file, path, lo, hi)
+                       for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+            for future in futures:
+                stats.merge(future.result())
+        return stats
+
+
+class HolidayCalendar:
+    """Base class for pluggable holiday calendars used by BusinessCalendar"""
+    
+    def holidays(self, year):
+        """Return the holiday dates falling in the given year"""
+        return ()
+
+
+class FixedHolidayCalendar(HolidayCalendar):
+    """Holidays from an explicit list of dates plus optional yearly (month, day) rules"""
+    
+    def __init__(self, dates=(), annual=()):
+        self.dates = {date.fromisoformat(d) if isinstance(d, str) else d for d in dates}
+        self.annual = set(annual)
+    
+    def holidays(self, year):
+        result = {d for d in self.dates if d.year == year}
+        for month, day in self.annual:
+            try:
+                result.add(date(year, month, day))
+            except ValueError:  # e.g. Feb 29 in a non-leap year
+                pass
+        return result
+
+
+class BusinessCalendar:
+    """Business-day arithmetic backed by a precomputed cumulative workday index
+    
+    For every day in the indexed range, _cumulative holds the number of
+    workdays before it and _workdays lists workday ordinals in order, so
+    counts and offsets are O(1) lookups. The range grows on demand.
+    """
+    
+    PADDING_YEARS = 10
+    
+    def __init__(self, holiday_calendar=None, weekend=(5, 6)):
+        self.holiday_calendar = holiday_calendar or HolidayCalendar()
+        self.weekend = frozenset(weekend)  # date.weekday() values
+        self._first_year = self._last_year = None
+    
+    def _build(self, first_year, last_year):
+        """(Re)build the index for whole years first_year..last_year"""
+        holidays = set()
+        for year in range(first_year, last_year + 1):
+            holidays.update(d.toordinal() for d in self.holiday_calendar.holidays(year))
+        
+        start = date(first_year, 1, 1).toordinal()
+        end = date(last_year, 12, 31).toordinal() + 1
+        cumulative = array("l", [0]) * (end - start + 1)
+        workdays = array("l")
+        count = 0
+        weekend = self.weekend
+        for ordinal in range(start, end):
+            cumulative[ordinal - start] = count
+            # Ordinal 1 (0001-01-01) was a Monday
+            if (ordinal - 1) % 7 not in weekend and ordinal not in holidays:
+                workdays.append(ordinal)
+                count += 1
+        cumulative[end - start] = count
+        
+        self._start, self._end = start, end
+        self._first_year, self._last_year = first_year, last_year
+        self._cumulative, self._workdays = cumulative, workdays
+    
+    def _ensure(self, *days):
+        """Make sure the index covers the given dates"""
+        low = min(d.year for d in days)
+        high = max(d.year for d in days)
+        if self._first_year is not None and self._first_year <= low and high <= self._last_year:
+            return
+        low = max(low - self.PADDING_YEARS, date.min.year)
+        high = min(high + self.PADDING_YEARS, date.max.year)
+        if self._first_year is not None:
+            low, high = min(low, self._first_year), max(high, self._last_year)
+        self._build(low, high)
+    
+    def is_business_day(self, day):
+        """Check whether a date is a workday"""
+        self._ensure(day)
+        i = day.toordinal() - self._start
+        return self._cumulative[i + 1] > self._cumulative[i]
+    
+    def business_days_between(self, start, end):
+        """Count workdays in [start, end); negative when end is before start"""
+        self._ensure(start, end)
+        return (self._cumulative[end.toordinal() - self._start]
+                - self._cumulative[start.toordinal() - self._start])
+    
+    def add_business_days(self, day, n):
+        """Move n workdays forward (or backward when n < 0) from a date"""
+        if n == 0:
+            return day
+        # Estimate the span needed (5 workdays per week plus holiday slack)
+        span = timedelta(days=abs(n) * 7 // 5 + 366)
+        try:
+            self._ensure(day, day + span if n > 0 else day - span)
+        except OverflowError:
+            raise ValueError("Business-day offset out of range") from None
+        i = day.toordinal() - self._start
+        if n > 0:
+            index = self._cumulative[i + 1] + n - 1
+        else:
+            index = self._cumulative[i] + n
+        if not 0 <= index < len(self._workdays):
+            # Holidays were denser than estimated; widen the index and retry
+            if self._first_year == date.min.year and self._last_year == date.max.year:
+                raise ValueError("Business-day offset out of range")
+            self._build(max(self._first_year - self.PADDING_YEARS, date.min.year),
+                        min(self._last_year + self.PADDING_YEARS, date.max.year))
+            return self.add_business_days(day, n)
+        return date.fromordinal(self._workdays[index])
+
+
+class DateCalculator:
+    """Exact calendar and business-day date arithmetic"""
+    
+    def __init__(self, business_calendar=None):
+        self.business = business_calendar or BusinessCalendar()
+    
+    @staticmethod
+    def add_months(day, months):
+        """Add calendar months, clamping to the end of shorter months"""
+        month_index = day.year * 12 + day.month - 1 + months
+        year, month = divmod(month_index, 12)
+        month += 1
+        next_month = date(year + month // 12, month % 12 + 1, 1)
+        last_day = (next_month - timedelta(days=1)).day
+        return date(year, month, min(day.day, last_day))
+    
+    def difference(self, start, end):
+        """Exact difference between two dates
+        
+        Returns a dict with calendar years, months and days (counted from the
+        earlier date), total days and business days in [earlier, later).
+        """
+        if isinstance(start, datetime):
+            start = start.date()
+        if isinstance(end, datetime):
+            end = end.date()
+        earlier, later = min(start, end), max(start, end)
+        
+        months = (later.year - earlier.year) * 12 + later.month - earlier.month
+        if self.add_months(earlier, months) > later:
+            months -= 1
+        days = (later - self.add_months(earlier, months)).days
+        return {
+            "years": months // 12,
+            "months": months % 12,
+            "days": days,
+            "total_days": (later - earlier).days,
+            "business_days": self.business.business_days_between(earlier, later)
+        }
+    
+    def add_days(self, day, n, business=False):
+        """Offset a date by n calendar days, or n business days"""
+        if isinstance(day, datetime):
+            day = day.date()
+        if business:
+            return self.business.add_business_days(day, n)
+        return day + timedelta(days=n)
+
+
+class BatchDateEngine:
+    """Vectorized date differences and offsets over NumPy datetime64 arrays
+    
+    Files are streamed in chunks of chunk_rows CSV lines, so memory use does
+    not depend on file size. Business-day rules come from a BusinessCalendar.
+    """
+    
+    def __init__(self, business_calendar=None, chunk_rows=200000):
+        if np is None:
+            raise ImportError("BatchDateEngine requires NumPy")
+        self.business = business_calendar or BusinessCalendar()
+        self.chunk_rows = chunk_rows
+        self.weekmask = [day not in self.business.weekend for day in range(7)]
+        self._holiday_years = (0, -1)
+        self._holidays = np.array([], dtype="datetime64[D]")
+        # Offsets are only meaningful where results convert back to datetime.date
+        self._date_range = (np.datetime64(date.min, "D"), np.datetime64(date.max, "D"))
+    
+    def parse(self, values):
+        """Parse ISO dates to datetime64[D]; unparseable entries become NaT"""
+        try:
+            # Fast path: NumPy's native ISO parser over the whole column
+            return np.array(values, dtype="datetime64[D]")
+        except ValueError:
+            pass
+        result = np.empty(len(values), dtype="datetime64[D]")
+        for i, value in enumerate(values):
+            try:
+                result[i] = np.datetime64(date.fromisoformat(value.strip()[:10]), "D")
+            except (AttributeError, ValueError):
+                result[i] = np.datetime64("NaT")
+        return result
+    
+    def differences(self, starts, ends, business=False):
+        """Return (days, valid) arrays for end - start, in calendar or business days"""
+        starts, ends = self._as_dates(starts), self._as_dates(ends)
+        valid = ~(np.isnat(starts) | np.isnat(ends))
+        days = np.zeros(len(starts), dtype=np.int64)
+        if business:
+            # Count [earlier, later) and negate reversed rows, as BusinessCalendar does
+            start, end = starts[valid], ends[valid]
+            counts = np.busday_count(np.minimum(start, end), np.maximum(start, end),
+                                     weekmask=self.weekmask,
+                                     holidays=self._holidays_for(start, end))
+            days[valid] = np.where(end < start, -counts, counts)
+        else:
+            days[valid] = (ends[valid] - starts[valid]).astype(np.int64)
+        return days, valid
+    
+    def offsets(self, starts, days, business=False):
+        """Offset dates by calendar or business days
+        
+        Invalid rows, and rows whose count or result falls outside the
+        datetime.date range, give NaT.
+        """
+        starts = self._as_dates(starts)
+        days = np.asarray(days, dtype=np.int64)
+        lowest, highest = self._date_range
+        span = (highest - lowest).astype(np.int64)
+        valid = ((starts >= lowest) & (starts <= highest)
+                 & (days >= -span) & (days <= span))
+        result = np.full(len(starts), np.datetime64("NaT"), dtype="datetime64[D]")
+        if not valid.any():
+            return result
+        start, n = starts[valid], days[valid]
+        if business:
+            ends = start + (np.abs(n) * 7 // 5 + 366) * np.sign(n)
+            holidays = self._holidays_for(start, np.minimum(np.maximum(ends, lowest), highest))
+            # Roll toward the start so non-workday starts match BusinessCalendar.add_business_days
+            forward = np.busday_offset(start, n, roll="backward", weekmask=self.weekmask,
+                                       holidays=holidays)
+            backward = np.busday_offset(start, n, roll="forward", weekmask=self.weekmask,
+                                        holidays=holidays)
+            shifted = np.where(n > 0, forward, np.where(n < 0, backward, start))
+        else:
+            shifted = start + n.astype("timedelta64[D]")
+        shifted[(shifted < lowest) | (shifted > highest)] = np.datetime64("NaT")
+        result[valid] = shifted
+        return result
+    
+    def process_file(self, src, dst, operation="diff", business=False):
+        """Stream a CSV of start,end (diff) or start,days (offset) rows to dst
+        
+        Each output row repeats the two input fields and appends the result
+        (empty when the row could not be parsed). Returns a stats dict with
+        rows, seconds and rows_per_second.
+        """
+        if operation not in ("diff", "offset"):
+            raise ValueError(f"Unknown operation: {operation}")
+        rows = 0
+        started = time.perf_counter()
+        with open(src, newline="") as fin, open(dst, "w", newline="") as fout:
+            first = True
+            while True:
+                lines = list(islice(fin, self.chunk_rows))
+                if not lines:
+                    break
+                fields = [line.rstrip("\r\n").split(",") for line in lines]
+                if first:
+                    first = False
+                    if fields and not fields[0][0].strip()[:1].isdigit():
+                        header = fields.pop(0)
+                        fout.write(",".join(header[:2] + ["result"]) + "\n")
+                fields = [f + [""] if len(f) < 2 else f for f in fields]
+                if not fields:
+                    continue
+                left = [f[0] for f in fields]
+                right = [f[1] for f in fields]
+                
+                if operation == "diff":
+                    days, valid = self.differences(left, right, business)
+                    results = np.where(valid, days.astype(str), "")
+                else:
+                    counts = [self._parse_count(v) for v in right]
+                    parsed = np.array([c is not None for c in counts])
+                    counts = np.array([c or 0 for c in counts], dtype=np.int64)
+                    shifted = self.offsets(left, counts, business)
+                    results = np.datetime_as_string(shifted, unit="D")
+                    results[np.isnat(shifted) | ~parsed] = ""
+                
+                fout.write("\n".join(f"{a},{b},{r}" for a, b, r in
+                                     zip(left, right, results.tolist())))
+                fout.write("\n")
+                rows += len(fields)
+        
+        seconds = time.perf_counter() - started
+        return {"rows": rows, "seconds": seconds,
+                "rows_per_second": rows / seconds if seconds > 0 else float("inf")}
+    
+    @staticmethod
+    def _parse_count(value):
+        """Day count as int, or None when the field isn't an integer"""
+        try:
+            return int(value)
+        except ValueError:
+            return None
+    
+    def _as_dates(self, values):
+        """Coerce input to a datetime64[D] array"""
+        if isinstance(values, np.ndarray) and values.dtype.kind == "M":
+            return values.astype("datetime64[D]")
+        return self.parse(list(values))
+    
+    def _holidays_for(self, starts, ends):
+        """Holiday array covering the given date range, cached by year span"""
+        if len(starts) == 0:
+            return self._holidays
+        years = np.concatenate([starts, ends]).astype("datetime64[Y]").astype(np.int64) + 1970
+        first = max(int(years.min()), date.min.year)
+        last = min(int(years.max()), date.max.year)
+        cached_first, cached_last = self._holiday_years
+        if not (cached_first <= first and last <= cached_last):
+            days = set()
+            for year in range(first, last + 1):
+                days.update(self.business.holiday_calendar.holidays(year))
+            self._holidays = np.array(sorted(days), dtype="datetime64[D]")
+            self._holiday_years = (first, last)
+        return self._holidays
 
 
 class WindowsCalculator(tk.Tk):
     """Main Calculator Application"""
     
+    PROGRAMMER_BASES = {"HEX": 16, "DEC": 10, "OCT": 8, "BIN": 2}
+    
     def __init__(self):
         super().__init__()
         
@@ -223,6 +2257,13 @@ class WindowsCalculator(tk.Tk):
         self.math_engine = MathEngine()
         self.conversion_service = ConversionService()
         self.programmer_calc = ProgrammerCalculator()
+        self.date_calc = DateCalculator()
+        self.graph_engine = GraphEngine()
+        self.graph_analyzer = GraphAnalyzer(self.graph_engine)
+        self.workspace = Workspace(self.math_engine)
+        self.matrix_service = None  # created on first use; needs NumPy
+        self.matrix_loaded = {}
+        self.matrix_result = None
         
         # State variables
         self.current_mode = CalculatorMode.STANDARD
@@ -235,6 +2276,25 @@ class WindowsCalculator(tk.Tk):
         self.setup_ui()
         self.bind_keyboard_shortcuts()
         
+        # Performance monitoring: mainloop heartbeat and hidden debug panel
+        self.debug_panel = None
+        self.stall_detector = StallDetector(self)
+        self.stall_detector.start()
+        
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def on_close(self):
+        """Release memory-mapped matrices and their temporary files, then exit"""
+        self.release_matrices()
+        self.destroy()
+    
+    def release_matrices(self):
+        """Drop loaded matrices so their temporary CSV-import files can be removed"""
+        self.matrix_loaded = {}
+        self.matrix_result = None
+        if self.matrix_service is not None:
+            self.matrix_service.close()
+        
     def setup_ui(self):
         """Setup the main user interface"""
         # Menu bar
@@ -269,11 +2329,14 @@ class WindowsCalculator(tk.Tk):
         # Load initial mode
         self.switch_mode(CalculatorMode.STANDARD)
     
+    @PERF.timed("switch_mode")
     def switch_mode(self, mode):
         """Switch between calculator modes"""
         self.current_mode = mode
         self.expression = ""
+        self.result = None
         self.display_text.set("0")
+        self.release_matrices()
         
         # Clear mode container
         for widget in self.mode_container.winfo_children():
@@ -292,6 +2355,12 @@ class WindowsCalculator(tk.Tk):
             self.setup_converter_mode()
         elif mode == CalculatorMode.GRAPHING:
             self.setup_graphing_mode()
+        elif mode == CalculatorMode.TABLE:
+            self.setup_table_mode()
+        elif mode == CalculatorMode.MATRIX:
+            self.setup_matrix_mode()
+        elif mode == CalculatorMode.STATISTICS:
+            self.setup_statistics_mode()
     
     def setup_standard_mode(self):
         """Setup Standard Calculator UI"""
@@ -335,7 +2404,8 @@ class WindowsCalculator(tk.Tk):
             ['xʸ', '7', '8', '9', '×'],
             ['log', '4', '5', '6', '-'],
             ['ln', '1', '2', '3', '+'],
-            ['sin', '±', '0', '.', '=']
+            ['sin', '±', '0', '.', '='],
+            ['Σ', 'Π', 'n', ',', 'CE']
         ]
         
         for row in func_buttons:
@@ -355,6 +2425,20 @@ class WindowsCalculator(tk.Tk):
                     btn.config(bg="white")
                 
                 btn.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2, pady=2)
+        
+        # Variables and user functions, e.g. "r = 3" or "area(r) = pi*r**2"
+        var_frame = tk.Frame(self.mode_container, bg="#f3f3f3")
+        var_frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.var_entry = tk.Entry(var_frame, font=("Segoe UI", 11))
+        # Keep typing here from triggering the window-wide calculator shortcuts
+        self.var_entry.bindtags((self.var_entry, "Entry", "all"))
+        self.var_entry.bind("<Return>", self.handle_variable_entry)
+        self.var_entry.pack(fill=tk.X, padx=2, pady=2)
+        
+        self.var_list = tk.Listbox(var_frame, height=4, font=("Segoe UI", 10))
+        self.var_list.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        self.refresh_variable_list()
     
     def setup_programmer_mode(self):
         """Setup Programmer Calculator UI"""
@@ -368,13 +2452,33 @@ class WindowsCalculator(tk.Tk):
         self.current_base = tk.StringVar(value="DEC")
         for base in ["HEX", "DEC", "OCT", "BIN"]:
             tk.Radiobutton(base_frame, text=base, variable=self.current_base,
-                          value=base, font=("Segoe UI", 10)).pack(side=tk.LEFT, padx=5)
+                          value=base, font=("Segoe UI", 10),
+                          command=self.refresh_programmer_display).pack(side=tk.LEFT, padx=5)
+        
+        # Word size and binary file viewer
+        word_frame = tk.Frame(frame, bg="#f3f3f3")
+        word_frame.pack(fill=tk.X, padx=5)
+        
+        self.word_size_choice = ttk.Combobox(word_frame, state="readonly", width=8,
+                                             values=list(ProgrammerCalculator.WORD_SIZES))
+        self.word_size_choice.set(next(name for name, bits in ProgrammerCalculator.WORD_SIZES.items()
+                                       if bits == self.programmer_calc.word_size))
+        self.word_size_choice.pack(side=tk.LEFT, padx=5)
+        self.word_size_choice.bind("<<ComboboxSelected>>", self.update_word_size)
+        
+        self.prog_signed = tk.BooleanVar(value=self.programmer_calc.signed)
+        tk.Checkbutton(word_frame, text="Signed", variable=self.prog_signed,
+                      command=self.refresh_programmer_display,
+                      bg="#f3f3f3").pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(word_frame, text="View file...", command=self.open_dump_viewer,
+                 font=("Segoe UI", 10)).pack(side=tk.RIGHT, padx=5)
         
         # Programmer buttons
         prog_buttons = [
             ['A', 'B', 'C', 'D', 'E', 'F'],
             ['AND', 'OR', 'XOR', 'NOT', '<<', '>>'],
-            ['7', '8', '9', '÷', 'C', '⌫'],
+            ['7', '8', '9', '÷', 'CLR', '⌫'],
             ['4', '5', '6', '×', '(', ')'],
             ['1', '2', '3', '-', 'CE', '='],
             ['0', '.', '+']
@@ -422,6 +2526,33 @@ class WindowsCalculator(tk.Tk):
         self.date_result = tk.Label(frame, text="", font=("Segoe UI", 12),
                                    bg="white", fg="#0078d4")
         self.date_result.pack(pady=10)
+        
+        # Add or subtract days
+        tk.Label(frame, text="Add or subtract days from 'From':",
+                font=("Segoe UI", 12), bg="white").pack(anchor="w", pady=5)
+        
+        offset_frame = tk.Frame(frame, bg="white")
+        offset_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Label(offset_frame, text="Days:", bg="white").grid(row=0, column=0, sticky="w")
+        self.date_offset = tk.Entry(offset_frame, width=15)
+        self.date_offset.insert(0, "0")
+        self.date_offset.grid(row=0, column=1, padx=5)
+        
+        self.date_business_only = tk.BooleanVar(value=False)
+        tk.Checkbutton(offset_frame, text="Business days", variable=self.date_business_only,
+                      bg="white").grid(row=0, column=2, padx=5)
+        
+        tk.Button(frame, text="Calculate Date",
+                 command=self.calculate_date_offset,
+                 bg="#0078d4", fg="white", font=("Segoe UI", 11)).pack(pady=10)
+        
+        self.date_offset_result = tk.Label(frame, text="", font=("Segoe UI", 12),
+                                          bg="white", fg="#0078d4")
+        self.date_offset_result.pack(pady=10)
+        
+        tk.Button(frame, text="Batch file...", command=self.calculate_date_batch,
+                 font=("Segoe UI", 10)).pack(pady=5)
     
     def setup_converter_mode(self):
         """Setup Unit Converter UI"""
@@ -465,6 +2596,301 @@ class WindowsCalculator(tk.Tk):
         
         self.update_converter_units()
     
+    def setup_table_mode(self):
+        """Setup Table of Values UI"""
+        frame = tk.Frame(self.mode_container, bg="white")
+        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        tk.Label(frame, text="Table of Values", font=("Segoe UI", 16, "bold"),
+                bg="white").pack(pady=10)
+        
+        tk.Label(frame, text="f(x) =", font=("Segoe UI", 11), bg="white").pack(anchor="w")
+        self.table_equation = tk.Entry(frame, font=("Segoe UI", 12))
+        self.table_equation.insert(0, "x**2")
+        self.table_equation.pack(fill=tk.X, pady=5)
+        
+        range_frame = tk.Frame(frame, bg="white")
+        range_frame.pack(fill=tk.X, pady=5)
+        self.table_range = {}
+        for column, (label, default) in enumerate([("From", "-10"), ("To", "10"), ("Step", "0.5")]):
+            tk.Label(range_frame, text=label, bg="white").grid(row=0, column=column * 2, sticky="w")
+            entry = tk.Entry(range_frame, width=8)
+            entry.insert(0, default)
+            entry.grid(row=0, column=column * 2 + 1, padx=5)
+            self.table_range[label] = entry
+        
+        for entry in [self.table_equation] + list(self.table_range.values()):
+            entry.bindtags((entry, "Entry", "all"))
+        
+        button_frame = tk.Frame(frame, bg="white")
+        button_frame.pack(fill=tk.X, pady=5)
+        tk.Button(button_frame, text="Generate", command=self.generate_table,
+                 bg="#0078d4", fg="white", font=("Segoe UI", 11)).pack(side=tk.LEFT)
+        tk.Button(button_frame, text="Export CSV...", command=self.export_table,
+                 font=("Segoe UI", 11)).pack(side=tk.RIGHT)
+        
+        self.table_status = tk.Label(frame, text="", bg="white", fg="#0078d4")
+        self.table_status.pack(anchor="w")
+        
+        # Virtualized view: a fixed set of Treeview rows re-filled as the scrollbar moves
+        view_frame = tk.Frame(frame, bg="white")
+        view_frame.pack(fill=tk.BOTH, expand=True)
+        self.table_view = ttk.Treeview(view_frame, columns=("x", "fx"), show="headings",
+                                       height=12, selectmode="none")
+        self.table_view.heading("x", text="x")
+        self.table_view.heading("fx", text="f(x)")
+        self.table_scrollbar = tk.Scrollbar(view_frame, orient=tk.VERTICAL,
+                                            command=self.scroll_table)
+        self.table_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.table_view.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.table_rows = [self.table_view.insert("", tk.END, values=("", ""))
+                           for _ in range(int(self.table_view.cget("height")))]
+        
+        self.table_view.bind("<MouseWheel>",
+                             lambda e: self.scroll_table("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.table_view.bind("<Button-4>", lambda e: self.scroll_table("scroll", -3, "units"))
+        self.table_view.bind("<Button-5>", lambda e: self.scroll_table("scroll", 3, "units"))
+        
+        self.value_table = None
+        self.table_first_row = 0
+        self.generate_table()
+    
+    def generate_table(self):
+        """Create a lazily evaluated table for the entered equation and range"""
+        try:
+            self.value_table = ValueTable(self.graph_engine, self.table_equation.get(),
+                                          float(self.table_range["From"].get()),
+                                          float(self.table_range["To"].get()),
+                                          float(self.table_range["Step"].get()))
+        except (ValueError, SyntaxError) as e:
+            self.value_table = None
+            self.table_status.config(text=f"Error: {e}")
+            self.render_table()
+            return
+        self.table_status.config(text=f"{len(self.value_table):,} rows")
+        self.table_first_row = 0
+        self.render_table()
+    
+    def scroll_table(self, action, amount, unit=None):
+        """Scrollbar/mouse wheel handler: move the window of visible rows"""
+        if self.value_table is None:
+            return "break"
+        visible = len(self.table_rows)
+        if action == "moveto":
+            self.table_first_row = int(float(amount) * len(self.value_table))
+        elif unit == "pages":
+            self.table_first_row += int(amount) * visible
+        else:
+            self.table_first_row += int(amount)
+        self.render_table()
+        return "break"
+    
+    def render_table(self):
+        """Fill the visible Treeview rows from the value table"""
+        visible = len(self.table_rows)
+        if self.value_table is None:
+            rows, total = [], 1
+        else:
+            total = max(len(self.value_table), 1)
+            self.table_first_row = max(0, min(self.table_first_row, total - visible))
+            rows = self.value_table.rows(self.table_first_row, visible)
+        
+        for i, item in enumerate(self.table_rows):
+            if i < len(rows):
+                x, y = rows[i]
+                self.table_view.item(item, values=(f"{x:.10g}",
+                                                   f"{y:.10g}" if y == y else "undefined"))
+            else:
+                self.table_view.item(item, values=("", ""))
+        self.table_scrollbar.set(self.table_first_row / total,
+                                 min(self.table_first_row + visible, total) / total)
+    
+    def export_table(self):
+        """Stream the whole table to a CSV file"""
+        if self.value_table is None:
+            return
+        path = filedialog.asksaveasfilename(title="Export table", defaultextension=".csv")
+        if not path:
+            return
+        try:
+            self.table_status.config(text="Exporting...")
+            self.update_idletasks()
+            start = time.perf_counter()
+            rows = self.value_table.export_csv(path)
+            self.table_status.config(
+                text=f"Exported {rows:,} rows in {time.perf_counter() - start:.1f} s")
+        except OSError as e:
+            self.table_status.config(text=f"Error: {e}")
+    
+    def setup_matrix_mode(self):
+        """Setup Matrix and Vector UI"""
+        frame = tk.Frame(self.mode_container, bg="white")
+        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        tk.Label(frame, text="Matrix", font=("Segoe UI", 16, "bold"),
+                bg="white").pack(pady=10)
+        
+        try:
+            if self.matrix_service is None:
+                self.matrix_service = MatrixService()
+        except ImportError as e:
+            tk.Label(frame, text=str(e), font=("Segoe UI", 11), bg="white").pack(pady=10)
+            return
+        
+        self.matrix_inputs = {}
+        for name, default in (("A", "2 1; 1 3"), ("B", "1; 2")):
+            header = tk.Frame(frame, bg="white")
+            header.pack(fill=tk.X)
+            tk.Label(header, text=f"{name} (rows separated by ';'):", font=("Segoe UI", 11),
+                    bg="white").pack(side=tk.LEFT)
+            tk.Button(header, text="Load...", font=("Segoe UI", 9),
+                     command=lambda n=name: self.load_matrix(n)).pack(side=tk.RIGHT)
+            text = tk.Text(frame, height=3, font=("Consolas", 10))
+            text.bindtags((text, "Text", "all"))
+            text.insert("1.0", default)
+            text.pack(fill=tk.X, pady=2)
+            self.matrix_inputs[name] = text
+        
+        ops_frame = tk.Frame(frame, bg="white")
+        ops_frame.pack(fill=tk.X, pady=5)
+        for label, operation in (("A×B", "multiply"), ("det A", "determinant"),
+                                 ("A⁻¹", "inverse"), ("eig A", "eigenvalues"),
+                                 ("Solve Ax=B", "solve")):
+            tk.Button(ops_frame, text=label, font=("Segoe UI", 10),
+                     command=lambda op=operation: self.matrix_operation(op)).pack(
+                         side=tk.LEFT, fill=tk.X, expand=True, padx=1)
+        
+        self.matrix_output = tk.Text(frame, height=8, font=("Consolas", 10),
+                                     state=tk.DISABLED, bg="#f9f9f9")
+        self.matrix_output.pack(fill=tk.BOTH, expand=True, pady=5)
+        tk.Button(frame, text="Save result (.npy)...", font=("Segoe UI", 9),
+                 command=self.save_matrix_result).pack(anchor="e")
+    
+    def _matrix_value(self, name):
+        """Matrix for input A/B: the loaded array while its preview is untouched"""
+        text = self.matrix_inputs[name].get("1.0", "end-1c")
+        loaded = self.matrix_loaded.get(name)
+        if loaded is not None and loaded[0] == text:
+            return loaded[1]
+        return self.matrix_service.parse(text)
+    
+    def load_matrix(self, name):
+        """Import a matrix from CSV or .npy via memory mapping"""
+        path = filedialog.askopenfilename(title=f"Load matrix {name}",
+                                          filetypes=[("Matrices", "*.npy *.csv"),
+                                                     ("All files", "*")])
+        if not path:
+            return
+        # Release the matrix being replaced before mapping the new one
+        self.matrix_loaded.pop(name, None)
+        self.matrix_service.close()
+        try:
+            matrix = self.matrix_service.load(path)
+        except (OSError, ValueError) as e:
+            self._show_matrix_output(f"Error: {e}")
+            return
+        preview = self.matrix_service.preview(matrix)
+        widget = self.matrix_inputs[name]
+        widget.delete("1.0", tk.END)
+        widget.insert("1.0", preview)
+        self.matrix_loaded[name] = (preview, matrix)
+    
+    def matrix_operation(self, operation):
+        """Run a linear-algebra operation and show a summarized result"""
+        start = time.perf_counter()
+        try:
+            a = self._matrix_value("A")
+            method = getattr(self.matrix_service, operation)
+            if operation in ("multiply", "solve"):
+                result = method(a, self._matrix_value("B"))
+            else:
+                result = method(a)
+        except ValueError as e:
+            self._show_matrix_output(f"Error: {e}")
+            return
+        self.matrix_result = result
+        elapsed = (time.perf_counter() - start) * 1000
+        self._show_matrix_output(f"{self.matrix_service.preview(result)}\n\n({elapsed:.1f} ms)")
+    
+    def save_matrix_result(self):
+        """Save the full last result as .npy"""
+        if not isinstance(self.matrix_result, np.ndarray):
+            return
+        path = filedialog.asksaveasfilename(title="Save result", defaultextension=".npy")
+        if path:
+            np.save(path, self.matrix_result)
+    
+    def _show_matrix_output(self, text):
+        self.matrix_output.config(state=tk.NORMAL)
+        self.matrix_output.delete("1.0", tk.END)
+        self.matrix_output.insert("1.0", text)
+        self.matrix_output.config(state=tk.DISABLED)
+    
+    def setup_statistics_mode(self):
+        """Setup Statistics UI"""
+        frame = tk.Frame(self.mode_container, bg="white")
+        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        tk.Label(frame, text="Statistics", font=("Segoe UI", 16, "bold"),
+                bg="white").pack(pady=10)
+        
+        tk.Label(frame, text="Numbers (separated by spaces, commas or lines):",
+                font=("Segoe UI", 11), bg="white").pack(anchor="w")
+        self.stats_input = tk.Text(frame, height=5, font=("Segoe UI", 11))
+        self.stats_input.bindtags((self.stats_input, "Text", "all"))
+        self.stats_input.pack(fill=tk.X, pady=5)
+        
+        button_frame = tk.Frame(frame, bg="white")
+        button_frame.pack(fill=tk.X, pady=5)
+        tk.Button(button_frame, text="Calculate", command=self.calculate_statistics,
+                 bg="#0078d4", fg="white", font=("Segoe UI", 11)).pack(side=tk.LEFT)
+        tk.Button(button_frame, text="Load file...", command=self.load_statistics_file,
+                 font=("Segoe UI", 11)).pack(side=tk.RIGHT)
+        
+        self.stats_result = tk.Label(frame, text="", font=("Consolas", 11), bg="white",
+                                    fg="#0078d4", justify="left", anchor="w")
+        self.stats_result.pack(fill=tk.BOTH, expand=True, pady=10)
+    
+    def calculate_statistics(self):
+        """Statistics for the numbers typed into the input box"""
+        stats = RunningStats()
+        stats.update_from_text(self.stats_input.get("1.0", tk.END))
+        self.show_statistics(stats)
+    
+    def load_statistics_file(self):
+        """Stream a (possibly huge) numeric text file through worker processes"""
+        path = filedialog.askopenfilename(title="Numbers file")
+        if not path:
+            return
+        try:
+            self.stats_result.config(text="Processing...")
+            self.update_idletasks()
+            start = time.perf_counter()
+            if os.path.getsize(path) > 64 << 20:
+                stats = RunningStats.from_file_parallel(path)
+            else:
+                stats = RunningStats.from_file(path)
+            self.show_statistics(stats, time.perf_counter() - start)
+        except Exception as e:  # OSError, or BrokenProcessPool from the workers
+            self.stats_result.config(text=f"Error: {e}")
+    
+    def show_statistics(self, stats, seconds=None):
+        summary = stats.summary()
+        if not summary["count"]:
+            self.stats_result.config(text="No numbers found")
+            return
+        lines = [f"{'Count':10}{summary['count']:,}"]
+        for key, label in (("sum", "Sum"), ("mean", "Mean"), ("stdev", "Std dev"),
+                           ("variance", "Variance"), ("min", "Min"), ("p05", "5%"),
+                           ("median", "Median*"), ("p95", "95%"), ("max", "Max")):
+            lines.append(f"{label:10}{summary[key]:.10g}")
+        lines.append("* quantiles are approximate")
+        if summary["skipped"]:
+            lines.append(f"Skipped {summary['skipped']:,} non-numeric or non-finite entries")
+        if seconds is not None:
+            lines.append(f"{seconds:.2f} s ({summary['count'] / max(seconds, 1e-9):,.0f} values/s)")
+        self.stats_result.config(text="\n".join(lines))
+    
     def setup_graphing_mode(self):
         """Setup Graphing Calculator UI"""
         frame = tk.Frame(self.mode_container, bg="white")
@@ -483,6 +2909,31 @@ class WindowsCalculator(tk.Tk):
         tk.Button(frame, text="Plot Graph", command=self.plot_graph,
                  bg="#0078d4", fg="white", font=("Segoe UI", 12)).pack(pady=10)
         
+        # Numeric analysis of the plotted curve
+        analysis_frame = tk.Frame(frame, bg="white")
+        analysis_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Button(analysis_frame, text="Roots", font=("Segoe UI", 10),
+                 command=lambda: self.analyze_graph("roots")).pack(side=tk.LEFT, padx=2)
+        tk.Button(analysis_frame, text="Extrema", font=("Segoe UI", 10),
+                 command=lambda: self.analyze_graph("extrema")).pack(side=tk.LEFT, padx=2)
+        
+        self.integral_to = tk.Entry(analysis_frame, width=6)
+        self.integral_to.insert(0, "1")
+        self.integral_from = tk.Entry(analysis_frame, width=6)
+        self.integral_from.insert(0, "0")
+        tk.Button(analysis_frame, text="∫", font=("Segoe UI", 10),
+                 command=lambda: self.analyze_graph("integral")).pack(side=tk.RIGHT, padx=2)
+        self.integral_to.pack(side=tk.RIGHT)
+        tk.Label(analysis_frame, text="to", bg="white").pack(side=tk.RIGHT, padx=2)
+        self.integral_from.pack(side=tk.RIGHT)
+        for entry in (self.integral_from, self.integral_to):
+            entry.bindtags((entry, "Entry", "all"))
+        
+        self.graph_result = tk.Label(frame, text="", font=("Segoe UI", 10),
+                                    bg="white", fg="#0078d4", wraplength=380, justify="left")
+        self.graph_result.pack(fill=tk.X)
+        
         # Canvas for graph
         self.graph_canvas = tk.Canvas(frame, bg="white", height=300)
         self.graph_canvas.pack(fill=tk.BOTH, expand=True)
@@ -513,6 +2964,16 @@ class WindowsCalculator(tk.Tk):
             self.display_text.set(self.expression)
             self.result = None
         
+        # Grouping and series, e.g. Σ(n**2, n, 1, 100)
+        elif button_text in ['(', ')', ',', 'n', 'Σ', 'Π']:
+            token = button_text + '(' if button_text in ['Σ', 'Π'] else button_text
+            if self.result is not None or self.expression in ("", "0"):
+                self.expression = token
+                self.result = None
+            else:
+                self.expression += token
+            self.display_text.set(self.expression)
+        
         # Special functions
         elif button_text == '√':
             try:
@@ -627,7 +3088,7 @@ class WindowsCalculator(tk.Tk):
         # Equals
         elif button_text == '=':
             try:
-                result = self.math_engine.evaluate(self.expression)
+                result = self.workspace.evaluate(self.expression)
                 self.display_text.set(str(result))
                 self.math_engine.history.append(f"{self.expression} = {result}")
                 self.result = result
@@ -635,39 +3096,164 @@ class WindowsCalculator(tk.Tk):
             except Exception as e:
                 self.display_text.set("Error")
     
+    def handle_variable_entry(self, event=None):
+        """Define a variable/function or evaluate an expression using them"""
+        text = self.var_entry.get().strip()
+        if not text:
+            return
+        try:
+            if self.workspace.is_definition(text):
+                recomputed = self.workspace.define(text)
+                name = recomputed[0]
+                value = self.workspace.values.get(name)
+                if name in self.workspace.errors:
+                    self.display_text.set("Error")
+                elif not callable(value):
+                    self.display_text.set(str(value))
+            else:
+                result = self.workspace.evaluate(text)
+                self.display_text.set(str(result))
+                self.expression = str(result)
+                self.result = result
+            self.var_entry.delete(0, tk.END)
+        except ValueError:
+            self.display_text.set("Error")
+        self.refresh_variable_list()
+    
+    def refresh_variable_list(self):
+        """Show current definitions and their memoized values"""
+        self.var_list.delete(0, tk.END)
+        for name in self.workspace.definitions:
+            self.var_list.insert(tk.END, self.workspace.describe(name))
+    
     def handle_programmer_button(self, button_text):
         """Handle programmer mode buttons"""
-        current_base = self.current_base.get()
-        base_map = {"HEX": 16, "DEC": 10, "OCT": 8, "BIN": 2}
-        
-        current = self.display_text.get()
+        base = self.PROGRAMMER_BASES[self.current_base.get()]
         
-        if button_text in '0123456789ABCDEF':
-            if current == "0":
-                self.display_text.set(button_text)
+        if len(button_text) == 1 and button_text in '0123456789ABCDEF':
+            if self.result is not None or self.expression in ("", "0"):
+                self.expression = button_text
+                self.result = None
             else:
-                self.display_text.set(current + button_text)
+                self.expression += button_text
         
-        elif button_text in ['AND', 'OR', 'XOR', 'NOT', '<<', '>>']:
-            # Store operation for next calculation
-            self.prog_operation = button_text
-            self.prog_first_operand = int(current, base_map[current_base])
-            self.display_text.set("0")
+        elif button_text in ['AND', 'OR', 'XOR', '<<', '>>', '÷', '×', '-', '+']:
+            self.expression += f" {button_text} "
+            self.result = None
+        
+        elif button_text in ['NOT', '(', ')']:
+            if self.result is not None and button_text != ')':
+                self.expression = ""
+                self.result = None
+            self.expression += "NOT " if button_text == 'NOT' else button_text
         
         elif button_text == '=':
-            if hasattr(self, 'prog_operation'):
-                second = int(current, base_map[current_base])
-                result = self.programmer_calc.bitwise_operation(
-                    self.prog_first_operand, second, self.prog_operation
-                )
-                # Convert back to current base
-                converted = self.programmer_calc.convert_base(
-                    result, 10, base_map[current_base]
-                )
-                self.display_text.set(converted)
+            try:
+                result = self.programmer_calc.evaluate(self.expression or "0", base)
+            except ValueError:
+                self.display_text.set("Error")
+                return
+            self.result = result
+            self.expression = self.programmer_calc.format_value(result, base)
         
-        elif button_text == 'C':
-            self.display_text.set("0")
+        # Not 'C', which is the hex digit
+        elif button_text == 'CLR':
+            self.expression = ""
+            self.result = None
+        
+        elif button_text == 'CE':
+            self.expression = re.sub(r'[0-9A-F]+$', '', self.expression)
+        
+        elif button_text == '⌫':
+            self.expression = re.sub(r'\s*(AND|OR|XOR|NOT|<<|>>|\S)\s*$', '',
+                                     self.expression)
+        
+        self.display_text.set(self.expression or "0")
+    
+    def refresh_programmer_display(self):
+        """Re-display the last result using the current base, word size and sign"""
+        self.programmer_calc.signed = self.prog_signed.get()
+        if self.result is not None:
+            base = self.PROGRAMMER_BASES[self.current_base.get()]
+            self.expression = self.programmer_calc.format_value(self.result, base)
+            self.display_text.set(self.expression)
+    
+    def update_word_size(self, event=None):
+        """Apply the selected word size to the programmer engine"""
+        self.programmer_calc.word_size = ProgrammerCalculator.WORD_SIZES[
+            self.word_size_choice.get()]
+        self.refresh_programmer_display()
+    
+    def open_dump_viewer(self):
+        """Open a memory-mapped hex/bin/oct view of a binary file"""
+        path = filedialog.askopenfilename(title="View binary file")
+        if not path:
+            return
+        try:
+            view = BinaryDumpView(path, word_size=8,
+                                  base=self.PROGRAMMER_BASES[self.current_base.get()])
+        except (OSError, ValueError):
+            self.display_text.set("Error")
+            return
+        
+        window = tk.Toplevel(self)
+        window.title(os.path.basename(path))
+        window.protocol("WM_DELETE_WINDOW", lambda: (view.close(), window.destroy()))
+        
+        controls = tk.Frame(window)
+        controls.pack(fill=tk.X)
+        word_choice = ttk.Combobox(controls, state="readonly", width=8,
+                                   values=list(ProgrammerCalculator.WORD_SIZES))
+        word_choice.set("BYTE")
+        word_choice.pack(side=tk.LEFT, padx=5, pady=5)
+        endian_choice = ttk.Combobox(controls, state="readonly", width=8,
+                                     values=["little", "big"])
+        endian_choice.set("little")
+        endian_choice.pack(side=tk.LEFT, padx=5, pady=5)
+        
+        body = tk.Frame(window)
+        body.pack(fill=tk.BOTH, expand=True)
+        text = tk.Text(body, font=("Consolas", 10), wrap="none", height=24, width=72)
+        scrollbar = tk.Scrollbar(body, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        state = {"first": 0}
+        
+        def render():
+            # Only the rows that fit in the widget are decoded
+            visible = max(int(text.cget("height")), 1)
+            total = max(view.row_count, 1)
+            first = max(0, min(state["first"], total - visible))
+            state["first"] = first
+            text.config(state=tk.NORMAL)
+            text.delete("1.0", tk.END)
+            text.insert("1.0", "\n".join(view.rows(first, visible)))
+            text.config(state=tk.DISABLED)
+            scrollbar.set(first / total, min(first + visible, total) / total)
+        
+        def scroll(action, amount, unit=None):
+            visible = int(text.cget("height"))
+            if action == "moveto":
+                state["first"] = int(float(amount) * view.row_count)
+            elif unit == "pages":
+                state["first"] += int(amount) * visible
+            else:
+                state["first"] += int(amount)
+            render()
+        
+        def reconfigure(event=None):
+            view.configure(word_size=ProgrammerCalculator.WORD_SIZES[word_choice.get()],
+                           endian=endian_choice.get())
+            render()
+        
+        scrollbar.config(command=scroll)
+        text.bind("<MouseWheel>", lambda e: scroll("scroll", -1 if e.delta > 0 else 1) or "break")
+        text.bind("<Button-4>", lambda e: scroll("scroll", -3) or "break")
+        text.bind("<Button-5>", lambda e: scroll("scroll", 3) or "break")
+        word_choice.bind("<<ComboboxSelected>>", reconfigure)
+        endian_choice.bind("<<ComboboxSelected>>", reconfigure)
+        render()
     
     def calculate_date_difference(self):
         """Calculate difference between two dates"""
@@ -675,16 +3261,45 @@ class WindowsCalculator(tk.Tk):
             date1 = datetime.strptime(self.date_from.get(), "%Y-%m-%d")
             date2 = datetime.strptime(self.date_to.get(), "%Y-%m-%d")
             
-            diff = abs((date2 - date1).days)
-            years = diff // 365
-            months = (diff % 365) // 30
-            days = (diff % 365) % 30
+            diff = self.date_calc.difference(date1, date2)
             
-            result = f"{years} years, {months} months, {days} days\n({diff} total days)"
+            result = (f"{diff['years']} years, {diff['months']} months, {diff['days']} days\n"
+                      f"({diff['total_days']} total days, {diff['business_days']} business days)")
             self.date_result.config(text=result)
         except Exception as e:
             self.date_result.config(text=f"Error: {str(e)}")
     
+    def calculate_date_offset(self):
+        """Add or subtract calendar or business days from the 'From' date"""
+        try:
+            start = datetime.strptime(self.date_from.get(), "%Y-%m-%d")
+            days = int(self.date_offset.get())
+            
+            result = self.date_calc.add_days(start, days,
+                                             business=self.date_business_only.get())
+            self.date_offset_result.config(text=result.strftime("%A, %Y-%m-%d"))
+        except Exception as e:
+            self.date_offset_result.config(text=f"Error: {str(e)}")
+    
+    def calculate_date_batch(self):
+        """Compute differences for a CSV of start,end rows and report throughput"""
+        src = filedialog.askopenfilename(title="Date pairs (start,end CSV)")
+        if not src:
+            return
+        dst = filedialog.asksaveasfilename(title="Save results", defaultextension=".csv")
+        if not dst:
+            return
+        try:
+            self.date_result.config(text="Processing...")
+            self.update_idletasks()
+            engine = BatchDateEngine(self.date_calc.business)
+            stats = engine.process_file(src, dst, business=self.date_business_only.get())
+            self.date_result.config(
+                text=f"{stats['rows']:,} rows in {stats['seconds']:.2f} s\n"
+                     f"({stats['rows_per_second']:,.0f} rows/s)")
+        except Exception as e:
+            self.date_result.config(text=f"Error: {str(e)}")
+    
     def update_converter_units(self, event=None):
         """Update unit dropdowns based on selected category"""
         category = self.conv_category.get()
@@ -724,60 +3339,9 @@ class WindowsCalculator(tk.Tk):
             if width < 2 or height < 2:
                 width, height = 400, 300
             
-            # Draw axes
-            center_x = width // 2
-            center_y = height // 2
-            
-            self.graph_canvas.create_line(0, center_y, width, center_y, 
-                                         fill="gray", width=2)  # X-axis
-            self.graph_canvas.create_line(center_x, 0, center_x, height, 
-                                         fill="gray", width=2)  # Y-axis
-            
-            # Scale for graph
-            scale_x = 20  # pixels per unit
-            scale_y = 20
-            
-            # Plot equation
-            points = []
-            x_range = width / scale_x
-            
-            for pixel_x in range(width):
-                x = (pixel_x - center_x) / scale_x
-                try:
-                    # Evaluate equation
-                    y = eval(equation, {"__builtins__": {}}, 
-                           {"x": x, "sin": math.sin, "cos": math.cos, 
-                            "tan": math.tan, "sqrt": math.sqrt, "exp": math.exp,
-                            "log": math.log, "abs": abs, "pi": math.pi, "e": math.e})
-                    
-                    # Convert to canvas coordinates
-                    pixel_y = center_y - (y * scale_y)
-                    
-                    # Only plot if within canvas bounds
-                    if 0 <= pixel_y <= height:
-                        points.append((pixel_x, pixel_y))
-                except:
-                    continue
-            
-            # Draw the curve
-            if len(points) > 1:
-                for i in range(len(points) - 1):
-                    self.graph_canvas.create_line(points[i][0], points[i][1],
-                                                 points[i+1][0], points[i+1][1],
-                                                 fill="#0078d4", width=2)
-            
-            # Add grid lines
-            for i in range(-10, 11):
-                if i != 0:
-                    x_pos = center_x + (i * scale_x)
-                    y_pos = center_y + (i * scale_y)
-                    
-                    if 0 <= x_pos <= width:
-                        self.graph_canvas.create_line(x_pos, 0, x_pos, height,
-                                                     fill="#e0e0e0", width=1)
-                    if 0 <= y_pos <= height:
-                        self.graph_canvas.create_line(0, y_pos, width, y_pos,
-                                                     fill="#e0e0e0", width=1)
+            points = self.graph_engine.sample(equation, width, height)
+            self.render_graph(points, width, height)
+            self.graph_size = (width, height)
             
         except Exception as e:
             self.graph_canvas.delete("all")
@@ -785,6 +3349,100 @@ class WindowsCalculator(tk.Tk):
                                          text=f"Error plotting: {str(e)}",
                                          fill="red", font=("Segoe UI", 12))
     
+    @PERF.timed("plot.render")
+    def render_graph(self, points, width, height,
+                     scale_x=GraphEngine.SCALE, scale_y=GraphEngine.SCALE):
+        """Draw axes, sampled curve and grid on the graph canvas"""
+        # Draw axes
+        center_x = width // 2
+        center_y = height // 2
+        
+        self.graph_canvas.create_line(0, center_y, width, center_y, 
+                                     fill="gray", width=2)  # X-axis
+        self.graph_canvas.create_line(center_x, 0, center_x, height, 
+                                     fill="gray", width=2)  # Y-axis
+        
+        # Draw the curve
+        if len(points) > 1:
+            for i in range(len(points) - 1):
+                self.graph_canvas.create_line(points[i][0], points[i][1],
+                                             points[i+1][0], points[i+1][1],
+                                             fill="#0078d4", width=2)
+        
+        # Add grid lines
+        for i in range(-10, 11):
+            if i != 0:
+                x_pos = center_x + (i * scale_x)
+                y_pos = center_y + (i * scale_y)
+                
+                if 0 <= x_pos <= width:
+                    self.graph_canvas.create_line(x_pos, 0, x_pos, height,
+                                                 fill="#e0e0e0", width=1)
+                if 0 <= y_pos <= height:
+                    self.graph_canvas.create_line(0, y_pos, width, y_pos,
+                                                 fill="#e0e0e0", width=1)
+    
+    def analyze_graph(self, kind):
+        """Find roots, extrema or a definite integral and mark them on the canvas"""
+        equation = self.graph_equation.get()
+        last = self.graph_engine.last_samples
+        if last is None or last[0] != equation:
+            self.plot_graph()
+        self.graph_canvas.delete("analysis")
+        width, height = getattr(self, "graph_size", (400, 300))
+        scale = GraphEngine.SCALE
+        
+        def to_canvas(x, y):
+            return width // 2 + x * scale, height // 2 - y * scale
+        
+        start = time.perf_counter()
+        try:
+            if kind == "roots":
+                roots = self.graph_analyzer.roots(equation)
+                for root in roots:
+                    px, py = to_canvas(root, 0)
+                    self.graph_canvas.create_oval(px - 4, py - 4, px + 4, py + 4, outline="red",
+                                                  width=2, tags="analysis")
+                text = "Roots: " + (", ".join(f"{r:.6g}" for r in roots) or "none in view")
+            
+            elif kind == "extrema":
+                extrema = self.graph_analyzer.extrema(equation)
+                for x, y, _ in extrema:
+                    px, py = to_canvas(x, y)
+                    self.graph_canvas.create_oval(px - 4, py - 4, px + 4, py + 4, fill="orange",
+                                                  outline="", tags="analysis")
+                text = "Extrema: " + (", ".join(f"{k} ({x:.6g}, {y:.6g})" for x, y, k in extrema)
+                                      or "none in view")
+            
+            else:
+                a, b = float(self.integral_from.get()), float(self.integral_to.get())
+                area = self.graph_analyzer.integrate(equation, a, b)
+                # Shade the visible part of the area between the curve and the x-axis,
+                # sampling at most once per pixel column
+                half_width = width / 2 / scale
+                lo, hi = sorted((a, b))
+                lo, hi = max(lo, -half_width), min(hi, half_width)
+                if lo < hi:
+                    steps = min(max(int((hi - lo) * scale), 2), width)
+                    xs = [lo + (hi - lo) * i / steps for i in range(steps + 1)]
+                    ys = self.graph_engine.evaluate_many(equation, xs)
+                    outline = [to_canvas(lo, 0)]
+                    for x, y in zip(xs, ys):
+                        if math.isfinite(y):
+                            px, py = to_canvas(x, y)
+                            outline.append((px, min(max(py, 0), height)))
+                    outline.append(to_canvas(hi, 0))
+                    self.graph_canvas.create_polygon(outline, fill="#cce4f7", outline="",
+                                                     tags="analysis")
+                    self.graph_canvas.tag_lower("analysis")
+                text = f"∫ from {a:g} to {b:g} = {area:.10g}"
+        except (ValueError, SyntaxError, MemoryError) as e:
+            text = f"Error: {e}"
+        
+        elapsed = (time.perf_counter() - start) * 1000
+        PERF.record(f"plot.{kind}", elapsed / 1000)
+        self.graph_result.config(text=f"{text}  ({elapsed:.1f} ms)")
+    
     def toggle_always_on_top(self):
         """Toggle always on top window attribute"""
         self.always_on_top = not self.always_on_top
@@ -844,6 +3502,57 @@ class WindowsCalculator(tk.Tk):
         self.bind('/', lambda e: self.handle_button('÷'))
         self.bind('.', lambda e: self.handle_button('.'))
         self.bind('%', lambda e: self.handle_button('%'))
+        
+        # Hidden performance panel (Ctrl+Shift+D)
+        self.bind('<Control-D>', lambda e: self.show_debug_panel())
+    
+    def show_debug_panel(self):
+        """Show live performance statistics with JSON export"""
+        if self.debug_panel is not None and self.debug_panel.winfo_exists():
+            self.debug_panel.lift()
+            return
+        
+        panel = tk.Toplevel(self)
+        panel.title("Performance")
+        self.debug_panel = panel
+        
+        text = tk.Text(panel, font=("Consolas", 9), width=80, height=30)
+        text.pack(fill=tk.BOTH, expand=True)
+        
+        def refresh():
+            if not panel.winfo_exists():
+                return
+            stats = PERF.snapshot()
+            lines = [f"Uptime {stats['uptime_s']:.0f} s", "",
+                     f"{'timing':26}{'count':>8}{'mean ms':>10}{'max ms':>10}"]
+            for name, t in sorted(stats["timings"].items()):
+                lines.append(f"{name:26}{t['count']:>8}{t['mean_ms']:>10.3f}{t['max_ms']:>10.3f}")
+            lines += ["", f"{'cache':26}{'hits':>8}{'misses':>10}{'rate':>10}"]
+            for name, c in sorted(stats["caches"].items()):
+                lines.append(f"{name:26}{c['hits']:>8}{c['misses']:>10}{c['hit_rate']:>10.1%}")
+            if stats["counters"]:
+                lines.append("")
+                lines += [f"{name:26}{n:>8}" for name, n in sorted(stats["counters"].items())]
+            text.config(state=tk.NORMAL)
+            text.delete("1.0", tk.END)
+            text.insert("1.0", "\n".join(lines))
+            text.config(state=tk.DISABLED)
+            panel.after(1000, refresh)
+        
+        def export():
+            path = filedialog.asksaveasfilename(parent=panel, defaultextension=".json",
+                                                title="Export performance data")
+            if path:
+                PERF.export_json(path)
+        
+        def reset():
+            PERF.reset()
+        
+        buttons = tk.Frame(panel)
+        buttons.pack(fill=tk.X)
+        tk.Button(buttons, text="Export JSON...", command=export).pack(side=tk.RIGHT, padx=5, pady=5)
+        tk.Button(buttons, text="Reset", command=reset).pack(side=tk.RIGHT, padx=5, pady=5)
+        refresh()
 
 
 # Additional Features and Services
@@ -865,8 +3574,17 @@ class CurrencyService:
         "MXN": 20.0
     }
     
-    def convert(self, amount, from_currency, to_currency):
-        """Convert between currencies using mock rates"""
+    def __init__(self, history=None):
+        # Optional RateHistoryStore used for as-of conversions
+        self.history = history
+    
+    def convert(self, amount, from_currency, to_currency, as_of=None):
+        """Convert between currencies using mock rates, or historical rates as of a date"""
+        if as_of is not None:
+            if self.history is None:
+                raise ValueError("No rate history loaded for as-of conversion")
+            return self.history.convert(amount, from_currency, to_currency, as_of)
+        
         if from_currency not in self.RATES or to_currency not in self.RATES:
             return amount
         
@@ -880,6 +3598,185 @@ class CurrencyService:
         return list(self.RATES.keys())
 
 
+class RateHistoryStore:
+    """Memory-mapped time series of exchange rates (USD as base)
+    
+    File layout (little-endian):
+        header   "CRH1", currency count (uint32)
+        index    per currency: code (8 bytes), data offset (uint64), row count (uint64)
+        data     per currency: rates (float64[count]), then day ordinals (int32[count])
+    
+    Each currency's dates and rates are exposed as views straight onto the
+    mapped file, so lookups never build Python objects for the whole history.
+    """
+    
+    MAGIC = b"CRH1"
+    BASE = "USD"
+    _HEADER = struct.Struct("<4sI")
+    _ENTRY = struct.Struct("<8sQQ")
+    _EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+    
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = self._HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC:
+            self.close()
+            raise ValueError(f"Not a rate history file: {path}")
+        
+        self._index = {}
+        pos = self._HEADER.size
+        for _ in range(count):
+            code, offset, rows = self._ENTRY.unpack_from(self._map, pos)
+            self._index[code.rstrip(b"\0").decode("ascii")] = (offset, rows)
+            pos += self._ENTRY.size
+        self._series = {}
+    
+    @classmethod
+    def build(cls, path, series):
+        """Write a store from {currency: iterable of (date, rate)}"""
+        blocks = []
+        for code, rows in series.items():
+            rows = sorted((cls._to_ordinal(d), float(r)) for d, r in rows)
+            ordinals = array("i", [d for d, _ in rows])
+            rates = array("d", [r for _, r in rows])
+            if sys.byteorder != "little":
+                ordinals.byteswap()
+                rates.byteswap()
+            blocks.append((code, len(rows), rates.tobytes() + ordinals.tobytes()))
+        
+        offset = cls._HEADER.size + cls._ENTRY.size * len(blocks)
+        with open(path, "wb") as f:
+            f.write(cls._HEADER.pack(cls.MAGIC, len(blocks)))
+            for code, rows, data in blocks:
+                f.write(cls._ENTRY.pack(code.encode("ascii"), offset, rows))
+                # Keep every float64 block 8-byte aligned
+                offset += len(data) + (-len(data) % 8)
+            for _, _, data in blocks:
+                f.write(data + b"\0" * (-len(data) % 8))
+        return cls(path)
+    
+    @classmethod
+    def build_from_csv(cls, csv_path, path):
+        """Write a store from a CSV file with date,currency,rate rows"""
+        series = {}
+        with open(csv_path, newline="") as f:
+            for row in csv.reader(f):
+                if not row or row[0].strip().lower() == "date":
+                    continue
+                series.setdefault(row[1].strip(), []).append((row[0].strip(), row[2]))
+        return cls.build(path, series)
+    
+    def close(self):
+        """Release the memory map and file handle"""
+        self._series = {}
+        self._map.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def currencies(self):
+        """Get list of currencies with history (the base currency is implicit)"""
+        return [self.BASE] + [c for c in self._index if c != self.BASE]
+    
+    def rate_as_of(self, currency, when):
+        """Get the latest rate for currency on or before the given date"""
+        if currency == self.BASE:
+            return 1.0
+        ordinals, rates = self._get_series(currency)
+        pos = bisect.bisect_right(ordinals, self._to_ordinal(when)) - 1
+        if pos < 0:
+            raise ValueError(f"No {currency} rate on or before {when}")
+        return rates[pos]
+    
+    def convert(self, amount, from_currency, to_currency, when):
+        """Convert an amount using the rates in effect on the given date"""
+        usd_amount = amount / self.rate_as_of(from_currency, when)
+        return usd_amount * self.rate_as_of(to_currency, when)
+    
+    def convert_batch(self, amounts, currencies, dates, to_currency=BASE):
+        """Convert (amount, currency, date) rows to one currency
+        
+        Rows without a rate on or before their date come back as NaN.
+        Uses NumPy searchsorted per currency when available.
+        """
+        if np is None:
+            results = []
+            for amount, code, when in zip(amounts, currencies, dates):
+                try:
+                    results.append(self.convert(amount, code, to_currency, when))
+                except (KeyError, ValueError):
+                    results.append(float("nan"))
+            return results
+        
+        amounts = np.asarray(amounts, dtype=np.float64)
+        codes = np.asarray(currencies)
+        ordinals = self._to_ordinals(dates)
+        from_rates = np.full(len(amounts), np.nan)
+        for code in np.unique(codes):
+            rows = np.nonzero(codes == code)[0]
+            from_rates[rows] = self._rates_as_of(str(code), ordinals[rows])
+        to_rates = self._rates_as_of(to_currency, ordinals)
+        return amounts / from_rates * to_rates
+    
+    def _rates_as_of(self, currency, ordinals):
+        """Vectorized as-of lookup, NaN where no rate applies"""
+        if currency == self.BASE:
+            return np.ones(len(ordinals))
+        if currency not in self._index:
+            return np.full(len(ordinals), np.nan)
+        offset, rows = self._index[currency]
+        rates = np.frombuffer(self._map, dtype="<f8", count=rows, offset=offset)
+        days = np.frombuffer(self._map, dtype="<i4", count=rows, offset=offset + 8 * rows)
+        pos = np.searchsorted(days, ordinals, side="right") - 1
+        result = rates[np.maximum(pos, 0)]
+        result[pos < 0] = np.nan
+        return result
+    
+    def _get_series(self, currency):
+        """Get (ordinals, rates) sequences mapped onto the file"""
+        if currency not in self._series:
+            if currency not in self._index:
+                raise KeyError(f"Unknown currency: {currency}")
+            offset, rows = self._index[currency]
+            view = memoryview(self._map)
+            rates = view[offset:offset + 8 * rows]
+            ordinals = view[offset + 8 * rows:offset + 12 * rows]
+            if sys.byteorder == "little":
+                rates, ordinals = rates.cast("d"), ordinals.cast("i")
+            else:
+                rates, ordinals = array("d", rates), array("i", ordinals)
+                rates.byteswap()
+                ordinals.byteswap()
+            self._series[currency] = (ordinals, rates)
+        return self._series[currency]
+    
+    @classmethod
+    def _to_ordinal(cls, when):
+        """Convert a date, datetime or ISO string to a proleptic ordinal"""
+        if isinstance(when, str):
+            when = date.fromisoformat(when[:10])
+        if isinstance(when, datetime):
+            when = when.date()
+        return when.toordinal()
+    
+    @classmethod
+    def _to_ordinals(cls, dates):
+        """Convert a sequence of dates to an int64 array of ordinals"""
+        days = np.asarray(dates)
+        if days.dtype.kind not in "MU":
+            days = np.array([cls._to_ordinal(d) for d in days], dtype=np.int64)
+            return days
+        if days.dtype.kind == "U":
+            days = days.astype("U10")
+        return days.astype("datetime64[D]").astype(np.int64) + cls._EPOCH_ORDINAL
+
+
 class HistoryManager:
     """Manage calculation history"""
     
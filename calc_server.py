@@ -0,0 +1,490 @@
+"""Local JSON-RPC 2.0 service exposing the calculator engines without the GUI
+
+Transports:
+    HTTP   POST a JSON-RPC request (or batch array) to http://host:port/
+    Unix   newline-delimited JSON-RPC messages on a Unix domain socket
+
+Identical requests that are in flight at the same time are coalesced into
+one computation. Expression evaluation runs in a process pool so expensive
+expressions (e.g. large factorials) never block the event loop; cheap
+conversions run inline. Pool evaluations that exceed the time limit
+fail with an engine error, and the pool is replaced so runaway workers are
+killed rather than left computing.
+
+Usage:
+    python calc_server.py --port 8765 --workers 4
+    python calc_server.py --unix /tmp/calc.sock --timeout 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import calc
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+ENGINE_ERROR = -32000
+
+MAX_BODY = 16 * 1024 * 1024
+
+
+class RpcError(Exception):
+    """JSON-RPC error with a protocol error code"""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+# Worker-process side: one set of engines per process
+
+_math_engine = None
+_programmer = None
+
+
+def _engines():
+    global _math_engine, _programmer
+    if _math_engine is None:
+        _math_engine = calc.MathEngine()
+        _programmer = calc.ProgrammerCalculator()
+    return _math_engine, _programmer
+
+
+def _evaluate_many(expressions):
+    """Evaluate expressions; errors are returned in place as {"error": message}"""
+    engine, _ = _engines()
+    results = []
+    for expression in expressions:
+        try:
+            results.append(str(engine.evaluate(expression)))
+        except ValueError as e:
+            results.append({"error": str(e)})
+    return results
+
+
+def _programmer_evaluate_many(expressions, base, word_size, signed):
+    _, programmer = _engines()
+    programmer.word_size = word_size
+    programmer.signed = signed
+    return programmer.evaluate_many(expressions, base)
+
+
+def _stop_pool(pool):
+    """Shut a process pool down without waiting for work that is still running
+
+    Workers are killed rather than terminated: they are forked after the
+    server installs its SIGTERM handler, so they would ignore SIGTERM.
+    """
+    kill = getattr(pool, "kill_workers", None)  # Python 3.14+
+    if kill is not None:
+        kill()
+        return
+    processes = list((pool._processes or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.kill()
+
+
+class CalcServer:
+    """asyncio JSON-RPC server over the calculator engines"""
+
+    CHUNK = 2000  # expressions per worker task in batch endpoints
+    TIMEOUT = 10.0  # seconds per worker task
+
+    def __init__(self, workers=None, timeout=TIMEOUT):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.pool = None
+        self.conversion_service = calc.ConversionService()
+        self.programmer = calc.ProgrammerCalculator()
+        self._in_flight = {}
+        self.coalesced = 0
+        self.timeouts = 0
+        self.methods = {
+            "evaluate": self.evaluate,
+            "evaluate_many": self.evaluate_many,
+            "convert": self.convert,
+            "convert_many": self.convert_many,
+            "convert_base": self.convert_base,
+            "convert_base_many": self.convert_base_many,
+            "programmer_evaluate": self.programmer_evaluate,
+            "programmer_evaluate_many": self.programmer_evaluate_many,
+            "stats": self.stats,
+        }
+
+    # Endpoints
+
+    async def evaluate(self, expression):
+        result = (await self._run_in_pool(_evaluate_many, [expression]))[0]
+        if isinstance(result, dict):
+            raise RpcError(ENGINE_ERROR, result["error"])
+        return result
+
+    async def evaluate_many(self, expressions):
+        chunks = [expressions[i:i + self.CHUNK] for i in range(0, len(expressions), self.CHUNK)]
+        parts = await asyncio.gather(*(self._run_in_pool(_evaluate_many, c) for c in chunks))
+        return [r for part in parts for r in part]
+
+    async def convert(self, value, category, from_unit, to_unit):
+        self._check_units(category, from_unit, to_unit)
+        return self.conversion_service.convert(float(value), category, from_unit, to_unit)
+
+    async def convert_many(self, values, category, from_unit, to_unit):
+        self._check_units(category, from_unit, to_unit)
+        convert = self.conversion_service.convert
+        return [convert(float(v), category, from_unit, to_unit) for v in values]
+
+    async def convert_base(self, value, from_base, to_base, word_size=64):
+        self.programmer.word_size = word_size
+        return self.programmer.convert_base(value, from_base, to_base)
+
+    async def convert_base_many(self, values, from_base, to_base, word_size=64):
+        self.programmer.word_size = word_size
+        return self.programmer.convert_many(values, from_base, to_base)
+
+    async def programmer_evaluate(self, expression, base=10, word_size=64, signed=True):
+        result = (await self._run_in_pool(
+            _programmer_evaluate_many, [expression], base, word_size, signed))[0]
+        if result is None:
+            raise RpcError(ENGINE_ERROR, f"Invalid expression: {expression!r}")
+        return result
+
+    async def programmer_evaluate_many(self, expressions, base=10, word_size=64, signed=True):
+        chunks = [expressions[i:i + self.CHUNK] for i in range(0, len(expressions), self.CHUNK)]
+        parts = await asyncio.gather(*(self._run_in_pool(
+            _programmer_evaluate_many, c, base, word_size, signed) for c in chunks))
+        return [r for part in parts for r in part]
+
+    async def stats(self):
+        return {"workers": self.workers, "in_flight": len(self._in_flight),
+                "coalesced": self.coalesced, "timeouts": self.timeouts}
+
+    # Dispatch
+
+    async def dispatch(self, message):
+        """Handle a decoded JSON-RPC message (single or batch); None means no reply"""
+        if isinstance(message, list):
+            if not message:
+                return self._error(None, INVALID_REQUEST, "Empty batch")
+            replies = await asyncio.gather(*(self._dispatch_one(m) for m in message))
+            replies = [r for r in replies if r is not None]
+            return replies or None
+        return await self._dispatch_one(message)
+
+    async def _dispatch_one(self, request):
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return self._error(None, INVALID_REQUEST, "Invalid request")
+        request_id = request.get("id")
+        params = request.get("params", {})
+        try:
+            method = self.methods.get(request["method"])
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+            result = await self._coalesced(request["method"], params, method)
+        except RpcError as e:
+            reply = self._error(request_id, e.code, str(e))
+        except TypeError as e:
+            reply = self._error(request_id, INVALID_PARAMS, str(e))
+        except (ValueError, KeyError) as e:
+            reply = self._error(request_id, ENGINE_ERROR, str(e))
+        else:
+            reply = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        # Requests without an id are notifications
+        return reply if "id" in request else None
+
+    async def _coalesced(self, name, params, method):
+        """Share one computation between identical concurrent requests"""
+        key = (name, json.dumps(params, sort_keys=True))
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            if isinstance(params, dict):
+                result = await method(**params)
+            elif isinstance(params, list):
+                result = await method(*params)
+            else:
+                raise RpcError(INVALID_PARAMS, "params must be an object or array")
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else was waiting
+            raise
+        finally:
+            del self._in_flight[key]
+
+    async def _run_in_pool(self, func, *args):
+        """Run func in the worker pool, bounded by the server timeout"""
+        pool = self.pool
+        future = asyncio.get_running_loop().run_in_executor(pool, func, *args)
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            if pool is not None and pool is self.pool:
+                self._recycle_pool()
+            raise RpcError(ENGINE_ERROR,
+                           f"Evaluation timed out after {self.timeout:g} s") from None
+        except BrokenProcessPool:
+            # Another request's timeout replaced the pool while this one was running
+            raise RpcError(ENGINE_ERROR, "Evaluation interrupted; retry the request") from None
+
+    def _recycle_pool(self):
+        """Replace the worker pool, killing workers stuck in runaway computations"""
+        pool, self.pool = self.pool, ProcessPoolExecutor(max_workers=self.workers)
+        _stop_pool(pool)
+
+    def _check_units(self, category, from_unit, to_unit):
+        conversions = calc.ConversionService.CONVERSIONS
+        if category not in conversions:
+            raise RpcError(INVALID_PARAMS, f"Unknown category: {category}")
+        units = conversions[category]["units"]
+        for unit in (from_unit, to_unit):
+            if unit not in units:
+                raise RpcError(INVALID_PARAMS, f"Unknown {category} unit: {unit}")
+
+    @staticmethod
+    def _error(request_id, code, message):
+        return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+    async def _handle_payload(self, payload):
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return self._error(None, PARSE_ERROR, "Parse error")
+        return await self.dispatch(message)
+
+    # Transports
+
+    async def handle_http(self, reader, writer):
+        """Serve HTTP/1.1 POST requests on one keep-alive connection"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                method = request_line.split(b" ", 1)[0]
+                length = int(headers.get("content-length", 0))
+                if method != b"POST" or length > MAX_BODY:
+                    status, body = (b"405 Method Not Allowed" if method != b"POST"
+                                    else b"413 Payload Too Large"), b""
+                else:
+                    reply = await self._handle_payload(await reader.readexactly(length))
+                    status = b"200 OK" if reply is not None else b"204 No Content"
+                    body = json.dumps(reply).encode() if reply is not None else b""
+
+                writer.write(b"HTTP/1.1 " + status + b"\r\n"
+                             b"Content-Type: application/json\r\n"
+                             b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close" or method != b"POST":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_lines(self, reader, writer):
+        """Serve newline-delimited JSON-RPC; replies may arrive out of order"""
+        pending = set()
+
+        async def respond(line):
+            reply = await self._handle_payload(line)
+            if reply is not None:
+                writer.write(json.dumps(reply).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    task = asyncio.ensure_future(respond(line))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765, unix_path=None, ready=None):
+        """Run until cancelled; ready (an asyncio.Event) is set once listening"""
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            if unix_path:
+                server = await asyncio.start_unix_server(self.handle_lines, path=unix_path,
+                                                         limit=MAX_BODY)
+            else:
+                server = await asyncio.start_server(self.handle_http, host, port)
+            async with server:
+                if ready is not None:
+                    ready.set()
+                await server.serve_forever()
+        finally:
+            _stop_pool(self.pool)
+
+
+class CalcClient:
+    """asyncio client for CalcServer over HTTP or a Unix socket"""
+
+    def __init__(self, host="127.0.0.1", port=8765, unix_path=None):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self._reader = self._writer = None
+        self._next_id = 0
+        self._pending = {}
+        self._lock = asyncio.Lock()
+        self._listener = None
+
+    async def connect(self):
+        if self.unix_path:
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                self.unix_path, limit=MAX_BODY)
+            self._listener = asyncio.ensure_future(self._listen())
+        else:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        return self
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def call(self, method, **params):
+        """Call one method, raising RpcError on failure"""
+        reply = await self._send({"jsonrpc": "2.0", "id": self._new_id(),
+                                  "method": method, "params": params})
+        return self._unwrap(reply)
+
+    async def batch(self, calls):
+        """Send [(method, params), ...] as one JSON-RPC batch; errors come back as RpcError objects"""
+        requests = [{"jsonrpc": "2.0", "id": self._new_id(), "method": m, "params": p}
+                    for m, p in calls]
+        replies = {r["id"]: r for r in await self._send(requests)}
+        results = []
+        for request in requests:
+            try:
+                results.append(self._unwrap(replies[request["id"]]))
+            except RpcError as e:
+                results.append(e)
+        return results
+
+    def _new_id(self):
+        self._next_id += 1
+        return self._next_id
+
+    @staticmethod
+    def _unwrap(reply):
+        if "error" in reply:
+            raise RpcError(reply["error"]["code"], reply["error"]["message"])
+        return reply["result"]
+
+    async def _send(self, message):
+        body = json.dumps(message).encode()
+        if self.unix_path:
+            # Line protocol is pipelined: match replies to requests by id
+            key = message[0]["id"] if isinstance(message, list) else message["id"]
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            self._writer.write(body + b"\n")
+            await self._writer.drain()
+            return await future
+
+        async with self._lock:
+            self._writer.write(b"POST / HTTP/1.1\r\nHost: " + self.host.encode() +
+                               b"\r\nContent-Type: application/json\r\nContent-Length: " +
+                               str(len(body)).encode() + b"\r\n\r\n" + body)
+            await self._writer.drain()
+            status = await self._reader.readline()
+            length = 0
+            while True:
+                line = await self._reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            if not status.startswith(b"HTTP/1.1 200"):
+                raise RpcError(INVALID_REQUEST, status.decode("latin-1").strip())
+            return json.loads(await self._reader.readexactly(length))
+
+    async def _listen(self):
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                for future in self._pending.values():
+                    future.set_exception(ConnectionError("Server closed the connection"))
+                self._pending.clear()
+                return
+            reply = json.loads(line)
+            key = reply[0]["id"] if isinstance(reply, list) else reply["id"]
+            future = self._pending.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(reply)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calculator JSON-RPC service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="serve on this Unix socket path instead of HTTP")
+    parser.add_argument("--workers", type=int, default=None, help="CPU worker processes")
+    parser.add_argument("--timeout", type=float, default=CalcServer.TIMEOUT,
+                        help="seconds before a worker evaluation is abandoned")
+    args = parser.parse_args()
+
+    server = CalcServer(workers=args.workers, timeout=args.timeout)
+    where = args.unix or f"http://{args.host}:{args.port}/"
+    print(f"Serving calculator engines on {where} ({server.workers} workers)")
+    asyncio.run(_serve_until_signalled(server, args))
+
+
+async def _serve_until_signalled(server, args):
+    """Serve until SIGINT/SIGTERM, letting serve() shut the worker pool down"""
+    task = asyncio.ensure_future(server.serve(args.host, args.port, args.unix))
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, task.cancel)
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Load test for calc_server: concurrent clients, throughput and latency percentiles
+
+Starts a server in a subprocess (or targets a running one with --connect)
+and drives it with a mix of evaluate, convert and programmer requests.
+
+Usage:
+    python loadtest.py --clients 32 --requests 500
+    python loadtest.py --unix /tmp/calc.sock --clients 64
+    python loadtest.py --connect --port 8765
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+
+from calc_server import CalcClient
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_calls(rng, count, distinct):
+    """Request mix; `distinct` bounds the pool of unique requests so some coalesce"""
+    calls = []
+    for _ in range(count):
+        n = rng.randrange(distinct)
+        kind = rng.random()
+        if kind < 0.4:
+            calls.append(("evaluate", {"expression": f"{n} × 3 + sqrt({n}) ÷ 7"}))
+        elif kind < 0.7:
+            calls.append(("convert", {"value": n, "category": "Length",
+                                      "from_unit": "Miles", "to_unit": "Kilometers"}))
+        elif kind < 0.9:
+            calls.append(("programmer_evaluate", {"expression": f"({n:X} + 3) AND FF << 2",
+                                                  "base": 16}))
+        else:
+            calls.append(("convert_base", {"value": str(n), "from_base": 10, "to_base": 2}))
+    return calls
+
+
+async def run_client(args, calls, latencies, errors):
+    async with CalcClient(args.host, args.port, args.unix) as client:
+        for method, params in calls:
+            start = time.perf_counter()
+            try:
+                await client.call(method, **params)
+            except Exception:
+                errors.append(method)
+            latencies.append(time.perf_counter() - start)
+
+
+async def wait_for_server(args, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            client = await CalcClient(args.host, args.port, args.unix).connect()
+            await client.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    workloads = [make_calls(rng, args.requests, args.distinct) for _ in range(args.clients)]
+    latencies, errors = [], []
+
+    await wait_for_server(args)
+    started = time.perf_counter()
+    await asyncio.gather(*(run_client(args, w, latencies, errors) for w in workloads))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(int(p / 100 * len(latencies)), len(latencies) - 1)] * 1e3
+
+    print(f"clients {args.clients}, requests {len(latencies)}, errors {len(errors)}")
+    print(f"throughput {len(latencies) / elapsed:,.0f} req/s over {elapsed:.2f} s")
+    print(f"latency p50 {percentile(50):.2f} ms, p90 {percentile(90):.2f} ms, "
+          f"p99 {percentile(99):.2f} ms, max {latencies[-1] * 1e3:.2f} ms")
+    return 1 if errors else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the calculator service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="use the Unix socket transport at this path")
+    parser.add_argument("--connect", action="store_true",
+                        help="use an already running server instead of starting one")
+    parser.add_argument("--workers", type=int, default=None, help="server worker processes")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--distinct", type=int, default=1000,
+                        help="number of distinct request variants per kind")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = None
+    if not args.connect:
+        command = [sys.executable, os.path.join(HERE, "calc_server.py"),
+                   "--host", args.host, "--port", str(args.port)]
+        if args.unix:
+            command += ["--unix", args.unix]
+        if args.workers:
+            command += ["--workers", str(args.workers)]
+        server = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    try:
+        return asyncio.run(run(args))
+    finally:
+        if server is not None:
+            # SIGTERM lets the server shut down its worker pool; kill only if it hangs
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+                server.wait()
+            if args.unix and os.path.exists(args.unix):
+                os.unlink(args.unix)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
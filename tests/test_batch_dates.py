@@ -0,0 +1,82 @@
+import csv
+from datetime import date, timedelta
+
+import pytest
+
+import calc
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def engine():
+    return calc.BatchDateEngine(chunk_rows=3)  # small chunks exercise the streaming path
+
+
+def run(engine, tmp_path, text, operation, business=False):
+    src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+    src.write_text(text)
+    stats = engine.process_file(str(src), str(dst), operation, business)
+    with open(dst, newline="") as f:
+        return stats, list(csv.reader(f))
+
+
+def test_diff_file(engine, tmp_path):
+    stats, rows = run(engine, tmp_path,
+                      "start,end\n2024-01-01,2024-01-08\n2024-01-08,2024-01-01\n"
+                      "bad,2024-01-01\n2024-02-28,2024-03-01\n", "diff")
+    assert stats["rows"] == 4
+    assert rows == [["start", "end", "result"],
+                    ["2024-01-01", "2024-01-08", "7"],
+                    ["2024-01-08", "2024-01-01", "-7"],
+                    ["bad", "2024-01-01", ""],
+                    ["2024-02-28", "2024-03-01", "2"]]
+
+
+def test_business_diff_file_matches_calendar(engine, tmp_path):
+    calendar = calc.BusinessCalendar()
+    first = date(2023, 12, 20)
+    pairs = [(first + timedelta(days=i), first + timedelta(days=3 * i % 40)) for i in range(20)]
+    text = "".join(f"{a},{b}\n" for a, b in pairs)
+    _, rows = run(engine, tmp_path, text, "diff", business=True)
+    assert [int(r[2]) for r in rows] == [
+        calendar.business_days_between(a, b) if a <= b else -calendar.business_days_between(b, a)
+        for a, b in pairs]
+
+
+def test_offset_file(engine, tmp_path):
+    _, rows = run(engine, tmp_path,
+                  "2024-01-05,1\n2024-01-05,+2\n2024-01-05,-5\n2024-01-05,abc\n"
+                  "2024-01-05,\n2024-01-05,1.5\nbad,1\n", "offset")
+    assert [r[2] for r in rows] == ["2024-01-06", "2024-01-07", "2023-12-31", "", "", "", ""]
+
+
+def test_business_offset_file_matches_calendar(engine, tmp_path):
+    calculator = calc.DateCalculator()
+    cases = [(date(2024, 1, 5), 1), (date(2024, 1, 6), 1), (date(2024, 1, 6), -1),
+             (date(2024, 2, 29), 1), (date(2024, 8, 30), 1), (date(2024, 3, 1), -3)]
+    _, rows = run(engine, tmp_path, "".join(f"{d},{n}\n" for d, n in cases), "offset",
+                  business=True)
+    assert [r[2] for r in rows] == [
+        calculator.add_days(d, n, business=True).isoformat() for d, n in cases]
+
+
+def test_unknown_operation(engine, tmp_path):
+    with pytest.raises(ValueError):
+        run(engine, tmp_path, "2024-01-01,1\n", "multiply")
+
+
+@pytest.mark.parametrize("business, next_day", [(False, "2024-01-06"), (True, "2024-01-08")])
+def test_offset_file_out_of_range(engine, tmp_path, business, next_day):
+    _, rows = run(engine, tmp_path,
+                  "2024-01-05,99999999999\n2024-01-05,-99999999999\n"
+                  "9999-12-30,5\n0001-01-02,-5\n2024-01-05,-9223372036854775808\n"
+                  "2024-01-05,1\n", "offset", business)
+    assert [r[2] for r in rows] == ["", "", "", "", "", next_day]
+
+
+def test_holidays_clamped_to_date_range(engine):
+    starts = np.array(["0001-01-01"], dtype="datetime64[D]")
+    ends = np.array(["20000-01-01"], dtype="datetime64[D]")
+    engine._holidays_for(starts, ends)
+    assert engine._holiday_years == (1, 9999)
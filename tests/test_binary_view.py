@@ -0,0 +1,94 @@
+import pytest
+
+import calc
+
+
+@pytest.fixture
+def prog():
+    return calc.ProgrammerCalculator()
+
+
+def test_convert_many_between_bases(prog):
+    assert prog.convert_many(["FF", "10", "0"], 16, 2) == ["11111111", "10000", "0"]
+    assert prog.convert_many([255, -1], 10, 16) == ["FF", "FFFFFFFFFFFFFFFF"]
+    assert prog.convert_many([], 16, 10) == []
+
+
+def test_convert_many_matches_convert_base(prog):
+    values = [format(n, "X") for n in range(0, 5000, 37)]
+    for to_base in (2, 8, 10, 16):
+        assert prog.convert_many(values, 16, to_base) == [
+            prog.convert_base(v, 16, to_base) for v in values]
+
+
+def test_convert_many_respects_word_size(prog):
+    prog.word_size = 8
+    assert prog.convert_many(["1FF", "-1"], 16, 16) == ["FF", "FF"]
+
+
+@pytest.mark.parametrize("values, from_base, to_base", [
+    (["12", "G"], 16, 10),
+    (["2"], 2, 10),
+    (["1"], 10, 3),
+])
+def test_convert_many_errors(prog, values, from_base, to_base):
+    with pytest.raises(ValueError):
+        prog.convert_many(values, from_base, to_base)
+
+
+@pytest.mark.parametrize("bits", [12, 0, "64", None])
+def test_invalid_word_size_leaves_state_unchanged(prog, bits):
+    prog.word_size = 16
+    with pytest.raises(ValueError, match="Unsupported word size"):
+        prog.word_size = bits
+    assert prog.word_size == 16
+    assert prog.mask == 0xFFFF
+
+
+@pytest.fixture
+def dump(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(40)))  # two full rows and a partial one
+    view = calc.BinaryDumpView(str(path))
+    yield view
+    view.close()
+
+
+def test_rows_in_hex_bytes(dump):
+    assert dump.row_count == 3
+    rows = dump.rows(0, 10)
+    assert len(rows) == 3
+    assert rows[0] == "000000000000: " + " ".join(f"{b:02X}" for b in range(16))
+    assert rows[2] == "000000000020: " + " ".join(f"{b:02X}" for b in range(32, 40))
+
+
+def test_words_respect_endianness(dump):
+    dump.configure(word_size=32)
+    assert dump.words(0, 2) == [0x03020100, 0x07060504]
+    dump.configure(endian="big")
+    assert dump.words(0, 1) == [0x00010203]
+
+
+def test_partial_word_is_zero_padded(tmp_path):
+    path = tmp_path / "odd.bin"
+    path.write_bytes(bytes(range(18)))
+    view = calc.BinaryDumpView(str(path), word_size=32)
+    try:
+        assert view.rows(1, 1) == ["000000000010: 00001110"]
+        view.configure(base=10)
+        assert view.rows(0, 1)[0].split(": ")[1].split()[0] == "0050462976"
+    finally:
+        view.close()
+
+
+def test_configure_rejects_invalid_settings(dump):
+    for kwargs in ({"word_size": 12}, {"endian": "middle"}, {"base": 3}):
+        with pytest.raises(ValueError):
+            dump.configure(**kwargs)
+
+
+def test_empty_file_rejected(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        calc.BinaryDumpView(str(path))
@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import calc_server
+from calc_server import ENGINE_ERROR, CalcServer
+
+EXPLOIT = ("[c for c in ().__class__.__base__.__subclasses__() if c.__name__ == 'Popen'][0]"
+           "(['touch', {path!r}]).wait()")
+
+
+def call(server, method, **params):
+    return asyncio.run(server.dispatch(
+        {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}))
+
+
+@pytest.fixture
+def server():
+    return CalcServer(workers=1)
+
+
+def test_evaluate(server):
+    assert call(server, "evaluate", expression="2 × (3 + 4)")["result"] == "14"
+
+
+def test_evaluate_rejects_code_execution(server, tmp_path):
+    target = tmp_path / "pwned"
+    reply = call(server, "evaluate", expression=EXPLOIT.format(path=str(target)))
+    assert reply["error"]["code"] == ENGINE_ERROR
+    assert not target.exists()
+
+
+@pytest.mark.parametrize("expression", [
+    "().__class__",
+    "(1).real",
+    "[1, 2][0]",
+    "[x for x in (1, 2)]",
+    "__import__('os')",
+    "'a' * 3",
+    "sqrt(x=4)",
+    "Σ(().__class__, n, 1, 2)",
+])
+def test_evaluate_rejects_unsafe_syntax(server, expression):
+    assert "error" in call(server, "evaluate", expression=expression)
+
+
+def test_evaluate_many_reports_errors_in_place(server):
+    result = call(server, "evaluate_many", expressions=["1 + 1", "().__class__"])["result"]
+    assert result[0] == "2"
+    assert "error" in result[1]
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("(3 > 0) * 3", "3"),
+    ("2 if 1 < 2 <= 3 else 5", "2"),
+    ("(1 == 1) and (2 != 3)", "1"),
+    ("not 0", "1"),
+])
+def test_evaluate_allows_comparisons_and_conditionals(server, expression, expected):
+    assert call(server, "evaluate", expression=expression)["result"] == expected
+
+
+@pytest.mark.parametrize("expression", ["1 in (1, 2)", "1 is 1"])
+def test_evaluate_rejects_membership_and_identity(server, expression):
+    assert "error" in call(server, "evaluate", expression=expression)
+
+
+def test_evaluate_times_out_and_replaces_pool():
+    server = CalcServer(workers=1, timeout=0.5)
+    server.pool = pool = ProcessPoolExecutor(max_workers=1)
+    try:
+        call(server, "evaluate", expression="1 + 1")  # start the worker
+        process = next(iter(pool._processes.values()))
+        reply = call(server, "evaluate", expression="9**9**9**9")
+        assert reply["error"]["code"] == ENGINE_ERROR
+        assert "timed out" in reply["error"]["message"]
+        assert server.pool is not pool
+        process.join(5)
+        assert not process.is_alive()
+        assert call(server, "evaluate", expression="2 + 2")["result"] == "4"
+        assert call(server, "stats")["result"]["timeouts"] == 1
+    finally:
+        calc_server._stop_pool(server.pool)
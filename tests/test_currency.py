@@ -0,0 +1,92 @@
+import math
+from datetime import date, datetime
+
+import pytest
+
+import calc
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = calc.RateHistoryStore.build(tmp_path / "rates.crh", {
+        "EUR": [(date(2024, 1, 10), 0.90), (date(2024, 1, 1), 0.80), (date(2024, 2, 1), 0.95)],
+        "GBP": [(date(2024, 1, 5), 0.75)],
+    })
+    yield store
+    store.close()
+
+
+def test_rate_as_of_uses_latest_rate_on_or_before(store):
+    assert store.rate_as_of("EUR", date(2024, 1, 1)) == 0.80
+    assert store.rate_as_of("EUR", date(2024, 1, 9)) == 0.80
+    assert store.rate_as_of("EUR", "2024-01-10") == 0.90
+    assert store.rate_as_of("EUR", datetime(2024, 3, 1, 12, 30)) == 0.95
+    assert store.rate_as_of("USD", date(1900, 1, 1)) == 1.0
+
+
+def test_rate_as_of_before_first_rate(store):
+    with pytest.raises(ValueError):
+        store.rate_as_of("EUR", date(2023, 12, 31))
+
+
+def test_rate_as_of_unknown_currency(store):
+    with pytest.raises(KeyError):
+        store.rate_as_of("XYZ", date(2024, 1, 1))
+
+
+def test_convert_between_currencies(store):
+    assert store.convert(90, "EUR", "GBP", date(2024, 1, 15)) == pytest.approx(75)
+    assert store.currencies() == ["USD", "EUR", "GBP"]
+
+
+def test_convert_batch_marks_missing_rates_nan(store):
+    results = store.convert_batch(
+        [80, 90, 75, 10, 5],
+        ["EUR", "EUR", "GBP", "XYZ", "EUR"],
+        [date(2024, 1, 2), "2024-01-20", date(2024, 1, 5), date(2024, 1, 5), date(2023, 6, 1)],
+    )
+    assert list(results[:3]) == pytest.approx([100, 100, 100])
+    assert math.isnan(results[3])
+    assert math.isnan(results[4])
+
+
+def test_convert_batch_to_other_currency(store):
+    results = store.convert_batch([100, 100], ["USD", "USD"], ["2024-01-01", "2024-01-04"], "GBP")
+    assert math.isnan(results[0])
+    assert math.isnan(results[1])
+    results = store.convert_batch([100], ["USD"], ["2024-01-05"], "GBP")
+    assert list(results) == pytest.approx([75])
+
+
+def test_convert_batch_accepts_datetime64(store):
+    np = pytest.importorskip("numpy")
+    dates = np.array(["2023-12-31", "2024-01-01", "2024-02-15"], dtype="datetime64[D]")
+    results = store.convert_batch([1, 1, 1], ["EUR", "EUR", "EUR"], dates)
+    assert math.isnan(results[0])
+    assert list(results[1:]) == pytest.approx([1 / 0.80, 1 / 0.95])
+
+
+def test_build_from_csv(tmp_path):
+    csv_path = tmp_path / "rates.csv"
+    csv_path.write_text("date,currency,rate\n2024-01-01,EUR,0.8\n\n2024-01-03,EUR,0.9\n")
+    with calc.RateHistoryStore.build_from_csv(csv_path, tmp_path / "rates.crh") as store:
+        assert store.rate_as_of("EUR", "2024-01-02") == 0.8
+        assert store.rate_as_of("EUR", "2024-01-03") == 0.9
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "bogus.crh"
+    path.write_bytes(b"NOPE" + b"\0" * 12)
+    with pytest.raises(ValueError):
+        calc.RateHistoryStore(path)
+
+
+def test_service_as_of_uses_history(store):
+    service = calc.CurrencyService(store)
+    assert service.convert(90, "EUR", "USD", as_of=date(2024, 1, 15)) == pytest.approx(100)
+    assert service.convert(85, "EUR", "USD") == pytest.approx(100)
+
+
+def test_service_as_of_without_history_raises():
+    with pytest.raises(ValueError):
+        calc.CurrencyService().convert(100, "EUR", "USD", as_of=date(2024, 1, 1))
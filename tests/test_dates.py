@@ -0,0 +1,68 @@
+from datetime import date
+
+import pytest
+
+import calc
+
+
+@pytest.fixture
+def calculator():
+    return calc.DateCalculator()
+
+
+@pytest.mark.parametrize("start, end, expected", [
+    (date(2024, 1, 31), date(2024, 2, 29), (0, 1, 0)),    # Jan 31 + 1 month clamps to Feb 29
+    (date(2024, 1, 31), date(2024, 3, 1), (0, 1, 1)),
+    (date(2023, 2, 28), date(2024, 2, 29), (1, 0, 1)),
+    (date(2024, 2, 29), date(2025, 2, 28), (1, 0, 0)),
+    (date(2024, 5, 15), date(2024, 5, 15), (0, 0, 0)),
+])
+def test_difference_around_month_ends(calculator, start, end, expected):
+    result = calculator.difference(start, end)
+    assert (result["years"], result["months"], result["days"]) == expected
+    assert result["total_days"] == (end - start).days
+
+
+def test_difference_is_symmetric(calculator):
+    a, b = date(2021, 3, 31), date(2024, 1, 15)
+    assert calculator.difference(a, b) == calculator.difference(b, a)
+
+
+@pytest.mark.parametrize("start, end, expected", [
+    (date(2024, 1, 1), date(2024, 1, 8), 5),    # Monday to Monday
+    (date(2024, 1, 6), date(2024, 1, 8), 0),    # Saturday to Monday
+    (date(2024, 1, 5), date(2024, 1, 6), 1),    # Friday counts, end is exclusive
+    (date(2024, 2, 26), date(2024, 3, 4), 5),   # across a leap-year month end
+])
+def test_business_days_between(calculator, start, end, expected):
+    assert calculator.difference(start, end)["business_days"] == expected
+
+
+@pytest.mark.parametrize("start, n, expected", [
+    (date(2024, 1, 5), 1, date(2024, 1, 8)),     # Friday + 1 -> Monday
+    (date(2024, 1, 8), -1, date(2024, 1, 5)),    # Monday - 1 -> Friday
+    (date(2024, 1, 6), 1, date(2024, 1, 8)),     # from a Saturday
+    (date(2024, 1, 6), -1, date(2024, 1, 5)),
+    (date(2024, 1, 31), 1, date(2024, 2, 1)),
+    (date(2024, 2, 29), 1, date(2024, 3, 1)),    # Thursday, leap day
+    (date(2024, 8, 30), 1, date(2024, 9, 2)),    # Friday at a month end
+    (date(2024, 3, 1), -1, date(2024, 2, 29)),
+    (date(2024, 1, 1), 0, date(2024, 1, 1)),
+    (date(2024, 1, 1), 260, date(2024, 12, 30)),
+])
+def test_add_business_days(calculator, start, n, expected):
+    assert calculator.add_days(start, n, business=True) == expected
+
+
+def test_add_business_days_skips_holidays():
+    holidays = calc.FixedHolidayCalendar(annual=[(12, 25), (1, 1)])
+    calculator = calc.DateCalculator(calc.BusinessCalendar(holidays))
+    assert calculator.add_days(date(2024, 12, 24), 1, business=True) == date(2024, 12, 26)
+    assert calculator.add_days(date(2024, 12, 31), 1, business=True) == date(2025, 1, 2)
+
+
+def test_add_months_clamps(calculator):
+    assert calculator.add_months(date(2024, 1, 31), 1) == date(2024, 2, 29)
+    assert calculator.add_months(date(2023, 1, 31), 1) == date(2023, 2, 28)
+    assert calculator.add_months(date(2024, 3, 31), -1) == date(2024, 2, 29)
+    assert calculator.add_months(date(2024, 12, 15), 1) == date(2025, 1, 15)
@@ -0,0 +1,77 @@
+import math
+
+import pytest
+
+import calc
+
+
+@pytest.fixture
+def engine():
+    return calc.GraphEngine()
+
+
+@pytest.fixture
+def analyzer(engine):
+    return calc.GraphAnalyzer(engine)
+
+
+def test_roots_from_last_plot(engine, analyzer):
+    engine.sample("x**2 - 2", 400, 300)
+    roots = analyzer.roots("x**2 - 2")
+    assert roots == pytest.approx([-math.sqrt(2), math.sqrt(2)], abs=1e-10)
+
+
+def test_roots_need_a_plot_or_samples(analyzer):
+    with pytest.raises(ValueError):
+        analyzer.roots("x - 1")
+
+
+def test_roots_include_exact_sample_zeros(analyzer):
+    xs = [i / 2 for i in range(-4, 5)]
+    assert analyzer.roots("x * (x - 1)", xs) == pytest.approx([0, 1])
+    assert analyzer.roots("x - 2", xs) == pytest.approx([2])
+
+
+def test_roots_skip_poles(engine, analyzer):
+    engine.sample("tan(x)", 400, 300)
+    roots = analyzer.roots("tan(x)")
+    assert roots == pytest.approx([k * math.pi for k in range(-3, 4)], abs=1e-9)
+
+
+def test_extrema(engine, analyzer):
+    engine.sample("sin(x)", 400, 300)
+    extrema = analyzer.extrema("sin(x)")
+    # Turning points of sin on the default -10..10 view are at (k + 1/2) * pi
+    expected = [(k + 0.5) * math.pi for k in range(-3, 3)]
+    assert [x for x, _, _ in extrema] == pytest.approx(expected, abs=1e-6)
+    for x, y, kind in extrema:
+        assert kind == ("max" if y > 0 else "min")
+        assert y == pytest.approx(math.copysign(1, y), abs=1e-12)
+
+
+def test_extrema_skip_poles(engine, analyzer):
+    engine.sample("1 / x", 400, 300)
+    assert analyzer.extrema("1 / x") == []
+
+
+@pytest.mark.parametrize("equation, a, b, expected", [
+    ("x**2", 0, 3, 9),
+    ("sin(x)", 0, math.pi, 2),
+    ("exp(x)", 1, 0, 1 - math.e),
+    ("sqrt(x)", 0, 1, 2 / 3),
+    ("x", 2, 2, 0),
+])
+def test_integrate(analyzer, equation, a, b, expected):
+    assert analyzer.integrate(equation, a, b) == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+def test_integrate_rejects_divergent_integrals(analyzer):
+    with pytest.raises(ValueError):
+        analyzer.integrate("1 / x", 0, 1)
+    with pytest.raises(ValueError):
+        analyzer.integrate("log(x)", -1, 1)
+
+
+def test_integrate_stops_at_evaluation_budget(analyzer):
+    result = analyzer.integrate("sin(1 / x)", 1e-6, 1, max_evaluations=500)
+    assert math.isfinite(result)
@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import calc
+
+
+@pytest.fixture
+def service():
+    service = calc.MatrixService()
+    yield service
+    service.close()
+
+
+def test_parse_accepts_semicolons_newlines_and_commas(service):
+    expected = np.array([[1.0, 2.0], [3.0, 4.0]])
+    assert np.array_equal(service.parse("1 2; 3 4"), expected)
+    assert np.array_equal(service.parse("1,2\n3, 4\n"), expected)
+
+
+@pytest.mark.parametrize("text", ["", " ; \n", "1 2; 3", "1 x"])
+def test_parse_rejects_bad_input(service, text):
+    with pytest.raises(ValueError):
+        service.parse(text)
+
+
+def test_multiply(service):
+    a = service.parse("1 2; 3 4")
+    b = service.parse("5; 6")
+    assert np.array_equal(service.multiply(a, b), [[17.0], [39.0]])
+    with pytest.raises(ValueError):
+        service.multiply(b, b)
+
+
+def test_determinant(service):
+    assert service.determinant(service.parse("1 2; 3 4")) == pytest.approx(-2)
+    sign, logdet = service.determinant(np.eye(400) * 100)
+    assert sign == 1.0
+    assert logdet == pytest.approx(400 * np.log(100))
+    with pytest.raises(ValueError):
+        service.determinant(service.parse("1 2 3"))
+
+
+def test_inverse_and_solve(service):
+    a = service.parse("4 7; 2 6")
+    assert np.allclose(service.inverse(a) @ a, np.eye(2))
+    assert np.allclose(service.solve(a, service.parse("1; 2")), [[-0.8], [0.6]])
+    singular = service.parse("1 2; 2 4")
+    with pytest.raises(ValueError):
+        service.inverse(singular)
+    with pytest.raises(ValueError):
+        service.solve(singular, service.parse("1; 2"))
+    with pytest.raises(ValueError):
+        service.solve(a, service.parse("1; 2; 3"))
+
+
+def test_eigenvalues(service):
+    assert np.allclose(sorted(service.eigenvalues(service.parse("2 1; 1 2"))), [1, 3])
+
+
+def test_load_csv_skips_blank_lines_and_cleans_up(service, tmp_path, monkeypatch):
+    monkeypatch.setattr(calc.MatrixService, "CSV_CHUNK_ROWS", 2)
+    path = tmp_path / "m.csv"
+    path.write_text("\n1,2\n\n3,4\n5,6\n  \n7,8\n")
+    matrix = service.load(str(path))
+    assert np.array_equal(matrix, [[1, 2], [3, 4], [5, 6], [7, 8]])
+    temp_path = matrix.filename
+    del matrix
+    service.close()
+    assert not service._temp_files
+    assert not os.path.exists(temp_path)
+
+
+@pytest.mark.parametrize("text", ["", "\n \n\n"])
+def test_load_empty_csv(service, tmp_path, text):
+    path = tmp_path / "empty.csv"
+    path.write_text(text)
+    with pytest.raises(ValueError, match="Empty matrix"):
+        service.load(str(path))
+    assert not service._temp_files
+
+
+def test_load_npy_is_memory_mapped(service, tmp_path):
+    path = tmp_path / "m.npy"
+    np.save(path, np.arange(6.0).reshape(2, 3))
+    matrix = service.load(str(path))
+    assert isinstance(matrix, np.memmap)
+    assert np.array_equal(matrix, [[0, 1, 2], [3, 4, 5]])
+
+
+def test_preview_summarizes_large_arrays(service):
+    text = service.preview(np.zeros((200, 200)))
+    assert text.startswith("200 × 200 float64")
+    assert "..." in text
+    assert service.preview(2.5) == "2.5"
+    assert service.preview((-1.0, 1000.0)) == "-exp(1000)"
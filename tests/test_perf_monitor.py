@@ -0,0 +1,91 @@
+import json
+from functools import lru_cache
+
+import pytest
+
+import calc
+
+
+@pytest.fixture
+def monitor():
+    return calc.PerfMonitor()
+
+
+def test_record_buckets_by_power_of_two_microseconds(monitor):
+    for seconds in (0.0000004, 0.000001, 0.000003, 0.003, 3600):
+        monitor.record("op", seconds)
+    stats = monitor.snapshot()["timings"]["op"]
+    assert stats["count"] == 5
+    assert stats["max_ms"] == 3600e3
+    assert stats["mean_ms"] == pytest.approx((3600 + 0.003 + 0.0000044) / 5 * 1e3)
+    assert stats["histogram_us"] == {"<1": 1, "<2": 1, "<4": 1, "<4096": 1,
+                                     f"<{1 << (monitor.BUCKETS - 1)}": 1}
+
+
+def test_counters_and_caches(monitor):
+    monitor.count("rows")
+    monitor.count("rows", 41)
+    monitor.cache_hit("chunks")
+    monitor.cache_hit("chunks")
+    monitor.cache_hit("chunks")
+    monitor.cache_miss("chunks")
+    snapshot = monitor.snapshot()
+    assert snapshot["counters"] == {"rows": 42}
+    assert snapshot["caches"]["chunks"] == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+
+
+def test_register_cache_reads_lru_cache_info(monitor):
+    @lru_cache(maxsize=None)
+    def square(n):
+        return n * n
+
+    monitor.register_cache("square", square)
+    square(2), square(2), square(3)
+    assert monitor.snapshot()["caches"]["square"] == {"hits": 1, "misses": 2,
+                                                      "hit_rate": pytest.approx(1 / 3)}
+
+
+def test_timed_records_calls_and_failures(monitor):
+    @monitor.timed("work")
+    def work(fail=False):
+        """Do some work"""
+        if fail:
+            raise ValueError("boom")
+        return 7
+
+    assert work() == 7
+    with pytest.raises(ValueError):
+        work(fail=True)
+    assert work.__doc__ == "Do some work"
+    assert monitor.snapshot()["timings"]["work"]["count"] == 2
+
+
+def test_timed_skips_recording_when_disabled(monitor):
+    work = monitor.timed("work")(lambda: 7)
+    monitor.enabled = False
+    assert work() == 7
+    assert monitor.snapshot()["timings"] == {}
+
+
+def test_reset_keeps_registered_caches(monitor):
+    @lru_cache(maxsize=None)
+    def identity(n):
+        return n
+
+    monitor.register_cache("identity", identity)
+    monitor.record("op", 0.001)
+    monitor.count("rows")
+    monitor.cache_miss("chunks")
+    monitor.reset()
+    snapshot = monitor.snapshot()
+    assert snapshot["timings"] == {} and snapshot["counters"] == {}
+    assert list(snapshot["caches"]) == ["identity"]
+
+
+def test_export_json(tmp_path, monitor):
+    monitor.record("op", 0.002)
+    path = tmp_path / "perf.json"
+    monitor.export_json(path)
+    data = json.loads(path.read_text())
+    assert data["timings"]["op"]["count"] == 1
+    assert data["uptime_s"] >= 0
@@ -0,0 +1,74 @@
+import pytest
+
+import calc
+from calc import _compile_int_expression
+
+
+@pytest.fixture
+def prog():
+    return calc.ProgrammerCalculator()
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("1 + 2 * 3", 7),
+    ("(1 + 2) * 3", 9),
+    ("1 + 2 << 3", 24),            # additive binds tighter than shifts
+    ("1 | 2 ^ 3 & 4", 3),           # | < ^ < &
+    ("6 AND 3 OR 8", 10),
+    ("-2 * -3", 6),
+    ("NOT 0 AND 5", 5),
+    ("7 / 2", 3),
+    ("-7 / 2", -3),                 # truncating, like C
+    ("-7 % 3", -1),
+    ("10 - 4 - 3", 3),              # left associative
+    ("2 × 3 ÷ 4", 1),
+])
+def test_precedence(prog, expression, expected):
+    assert prog.evaluate(expression) == expected
+
+
+def test_rpn_shape():
+    assert _compile_int_expression("1 + 2 * 3", 10) == (1, 2, 3, "*", "+")
+    assert _compile_int_expression("FF AND 0F", 16) == (255, 15, "&")
+
+
+@pytest.mark.parametrize("expression, base", [
+    ("", 10),
+    ("1 +", 10),
+    ("(1 + 2", 10),
+    ("1 + 2)", 10),
+    ("2 3", 10),
+    ("1 $ 2", 10),
+    ("* 2", 10),
+    ("1 NOT 2", 10),
+    ("9", 8),
+    ("G", 16),
+])
+def test_errors(prog, expression, base):
+    with pytest.raises(ValueError):
+        prog.evaluate(expression, base)
+
+
+def test_division_by_zero_is_an_error(prog):
+    with pytest.raises(ValueError):
+        prog.evaluate("1 / 0")
+
+
+def test_signed_wrap(prog):
+    prog.word_size = 8
+    assert prog.evaluate("127 + 1") == -128
+    assert prog.evaluate("-128 - 1") == 127
+    assert prog.evaluate("NOT 0") == -1
+    assert prog.format_value(prog.evaluate("-1"), 16) == "FF"
+
+
+def test_unsigned_wrap(prog):
+    prog.word_size = 16
+    prog.signed = False
+    assert prog.evaluate("0 - 1") == 0xFFFF
+    assert prog.evaluate("FFFF + 2", 16) == 1
+    assert prog.evaluate("1 << 16") == 0
+
+
+def test_evaluate_many_marks_invalid_entries(prog):
+    assert prog.evaluate_many(["1 + 1", "1 +", "F * 2"], 16) == [2, None, 30]
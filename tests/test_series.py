@@ -0,0 +1,83 @@
+import math
+
+import pytest
+
+import calc
+
+
+@pytest.fixture
+def engine():
+    return calc.MathEngine()
+
+
+def value(engine, expression):
+    return float(engine.evaluate(expression))
+
+
+@pytest.mark.parametrize("term, start, end", [
+    ("n", 1, 100),
+    ("n**2", 1, 100),
+    ("n**3 - 2*n + 7", -20, 35),
+    ("(n + 1)*(n - 1)/2", -5, 5),
+    ("3", 4, 9),
+    ("2**n", 0, 30),
+    ("3 * 0.5**n", 0, 60),
+    ("-2 * 3**(2*n + 1)", 1, 10),
+    ("sin(n)", 1, 1000),
+    ("1/n**2", 1, 10000),
+])
+def test_sum_matches_brute_force(engine, term, start, end):
+    code = compile(term, "<term>", "eval")
+    expected = math.fsum(eval(code, dict(math.__dict__), {"n": n}) for n in range(start, end + 1))
+    assert value(engine, f"Σ({term}, n, {start}, {end})") == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("term, start, end", [
+    ("n", 1, 20),
+    ("n", 5, 12),
+    ("2", 1, 30),
+    ("2**n", 1, 10),
+    ("1 + 1/n", 1, 1000),
+    ("n", -3, 3),
+])
+def test_product_matches_brute_force(engine, term, start, end):
+    code = compile(term, "<term>", "eval")
+    expected = math.prod(eval(code, {}, {"n": n}) for n in range(start, end + 1))
+    assert value(engine, f"Π({term}, n, {start}, {end})") == pytest.approx(expected, rel=1e-12)
+
+
+def test_closed_forms_are_exact(engine):
+    n = 10**8
+    assert engine.evaluate(f"Σ(n, n, 1, {n})") == n * (n + 1) // 2
+    assert engine.evaluate(f"Σ(n**2, n, 1, {n})") == n * (n + 1) * (2 * n + 1) // 6
+    assert engine.evaluate("Π(n, n, 1, 20)") == math.factorial(20)
+
+
+def test_empty_ranges(engine):
+    assert engine.evaluate("Σ(n, n, 10, 1)") == 0
+    assert engine.evaluate("Π(n, n, 10, 1)") == 1
+
+
+def test_nested_series_and_outer_variable(engine):
+    expected = sum(k * n for n in range(1, 11) for k in range(1, n + 1))
+    assert value(engine, "Σ(Σ(k*n, k, 1, n), n, 1, 10)") == expected
+
+
+@pytest.mark.parametrize("expression", [
+    "Σ(exp(n), n, 1, 1000)",
+    "Σ(10.0**n, n, 1, 400)",
+    "Σ(1/n, n, 0, 10)",
+    "Σ(n, n, 1, 2.5)",
+])
+def test_invalid_series_raise(engine, expression):
+    with pytest.raises(ValueError):
+        engine.evaluate(expression)
+
+
+def test_workspace_tracks_variables_inside_series():
+    workspace = calc.Workspace(calc.MathEngine())
+    workspace.define("r = 2")
+    workspace.define("s = Σ(r*n, n, 1, 10)")
+    assert workspace.values["s"] == 110
+    workspace.define("r = 3")
+    assert workspace.values["s"] == 165
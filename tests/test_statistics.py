@@ -0,0 +1,82 @@
+import math
+import random
+import statistics
+
+import pytest
+
+import calc
+
+
+def reference(values):
+    return {"count": len(values), "sum": math.fsum(values), "mean": statistics.fmean(values),
+            "variance": statistics.variance(values), "min": min(values), "max": max(values)}
+
+
+def check(stats, values):
+    expected = reference(values)
+    assert stats.count == expected["count"]
+    assert stats.sum == pytest.approx(expected["sum"], rel=1e-12)
+    assert stats.mean == pytest.approx(expected["mean"], rel=1e-12)
+    assert stats.variance == pytest.approx(expected["variance"], rel=1e-9)
+    assert (stats.min, stats.max) == (expected["min"], expected["max"])
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(7)
+    return [rng.gauss(1e6, 3.0) for _ in range(5000)]
+
+
+def test_merge_matches_statistics(values):
+    parts = [values[:1], values[1:1200], values[1200:1201], values[1201:]]
+    merged = calc.RunningStats()
+    for part in parts:
+        stats = calc.RunningStats()
+        stats.update(part)
+        merged.merge(stats)
+    check(merged, values)
+
+
+def test_add_and_update_agree(values):
+    one, batch = calc.RunningStats(), calc.RunningStats()
+    for value in values:
+        one.add(value)
+    batch.update(values)
+    check(one, values)
+    check(batch, values)
+
+
+def test_merge_with_empty():
+    stats = calc.RunningStats()
+    stats.update([1.0, 2.0, 3.0])
+    stats.merge(calc.RunningStats())
+    check(stats, [1.0, 2.0, 3.0])
+    empty = calc.RunningStats().merge(stats)
+    check(empty, [1.0, 2.0, 3.0])
+
+
+def test_text_skips_non_numeric_and_non_finite():
+    stats = calc.RunningStats()
+    stats.update_from_text("1 2 3 4 nan 5, inf; -inf x")
+    check(stats, [1.0, 2.0, 3.0, 4.0, 5.0])
+    assert stats.skipped == 4
+
+
+def test_file_ranges_cover_each_line_once(tmp_path, values):
+    path = tmp_path / "numbers.txt"
+    path.write_text("\n".join(repr(v) for v in values) + "\n")
+    size = path.stat().st_size
+    bounds = [0, 1, size // 3, size // 3 + 1, size - 2, size]
+    merged = calc.RunningStats()
+    for lo, hi in zip(bounds, bounds[1:]):
+        merged.merge(calc.RunningStats.from_file(str(path), lo, hi, chunk_bytes=4096))
+    check(merged, values)
+
+
+def test_quantiles_are_close(values):
+    stats = calc.RunningStats()
+    stats.update(values)
+    ordered = sorted(values)
+    for q in (0.05, 0.5, 0.95):
+        rank = sum(1 for v in ordered if v <= stats.quantile(q)) / len(ordered)
+        assert abs(rank - q) < 0.02
@@ -0,0 +1,78 @@
+import math
+
+import pytest
+
+import calc
+
+
+def table(equation="x**2", start=0, stop=1, step=0.1):
+    return calc.ValueTable(calc.GraphEngine(), equation, start, stop, step)
+
+
+@pytest.mark.parametrize("start, stop, step, expected", [
+    (0, 1, 0.1, 11),       # floating-point step still includes the stop value
+    (0, 10, 3, 4),
+    (5, 5, 1, 1),
+    (10, 0, -2.5, 5),
+    (0, 1e9, 1, 1_000_000_001),
+])
+def test_row_count(start, stop, step, expected):
+    assert len(table(start=start, stop=stop, step=step)) == expected
+
+
+@pytest.mark.parametrize("start, stop, step", [
+    (0, 1, 0),
+    (0, 1, -0.1),
+    (0, math.inf, 1),
+    (math.nan, 1, 1),
+    (-1e308, 1e308, 1e-300),
+])
+def test_rejects_bad_ranges(start, stop, step):
+    with pytest.raises(ValueError):
+        table(start=start, stop=stop, step=step)
+
+
+def test_rejects_bad_equation():
+    with pytest.raises((ValueError, SyntaxError)):
+        table("x +")
+
+
+def test_rows_span_chunks(monkeypatch):
+    monkeypatch.setattr(calc.ValueTable, "CHUNK_ROWS", 4)
+    values = table("2 * x", 0, 9, 1)
+    assert values.rows(2, 5) == [(x, 2.0 * x) for x in range(2, 7)]
+    assert values.rows(8, 10) == [(8.0, 16.0), (9.0, 18.0)]
+    assert values.rows(-3, 2) == [(0.0, 0.0), (1.0, 2.0)]
+    assert values.rows(20, 5) == []
+
+
+def test_failed_points_are_nan():
+    rows = table("sqrt(x)", -1, 1, 1).rows(0, 3)
+    assert math.isnan(rows[0][1])
+    assert rows[1:] == [(0.0, 0.0), (1.0, 1.0)]
+
+
+def test_chunk_cache_is_bounded_lru(monkeypatch):
+    monkeypatch.setattr(calc.ValueTable, "CHUNK_ROWS", 10)
+    monkeypatch.setattr(calc.ValueTable, "MAX_CACHED_CHUNKS", 3)
+    values = table("x", 0, 99, 1)
+    for first in (0, 10, 20, 0, 30):
+        values.rows(first, 1)
+    assert list(values._chunks) == [2, 0, 3]  # chunk 1 was least recently used
+
+
+def test_huge_range_only_computes_viewed_chunks():
+    values = table("x", 0, 1e12, 1)
+    assert values.rows(10**11, 2) == [(1e11, 1e11), (1e11 + 1, 1e11 + 1)]
+    assert len(values._chunks) == 1
+
+
+def test_export_csv_leaves_cache_alone(tmp_path, monkeypatch):
+    monkeypatch.setattr(calc.ValueTable, "CHUNK_ROWS", 4)
+    values = table("1 / x", -2, 2, 1)
+    values.rows(0, 1)
+    path = tmp_path / "table.csv"
+    assert values.export_csv(path) == 5
+    assert path.read_text().splitlines() == [
+        "x,f(x)", "-2.0,-0.5", "-1.0,-1.0", "0.0,", "1.0,1.0", "2.0,0.5"]
+    assert list(values._chunks) == [0]
@@ -0,0 +1,81 @@
+import pytest
+
+import calc
+
+
+@pytest.fixture
+def workspace():
+    return calc.Workspace(calc.MathEngine())
+
+
+def test_recompute_order_is_topological(workspace):
+    workspace.define("a = 1")
+    workspace.define("b = a + 1")
+    workspace.define("c = a * b")
+    workspace.define("d = c + b")
+    order = workspace.define("a = 2")
+    assert order[0] == "a"
+    assert order.index("b") < order.index("c") < order.index("d")
+    assert (workspace.values["b"], workspace.values["c"], workspace.values["d"]) == (3, 6, 9)
+
+
+def test_only_dependents_are_recomputed(workspace):
+    workspace.define("a = 1")
+    workspace.define("b = 2")
+    workspace.define("c = a + 1")
+    workspace.define("d = b + 1")
+    assert sorted(workspace.define("a = 5")) == ["a", "c"]
+
+
+def test_forward_reference_resolves_when_defined(workspace):
+    workspace.define("y = x * 2")
+    assert "y" in workspace.errors
+    assert workspace.define("x = 4") == ["x", "y"]
+    assert workspace.values["y"] == 8
+    assert "y" not in workspace.errors
+
+
+def test_remove_turns_dependents_into_errors(workspace):
+    workspace.define("x = 4")
+    workspace.define("y = x + 1")
+    workspace.remove("x")
+    assert "x" not in workspace.values
+    assert workspace.errors["y"] == "Undefined: x"
+
+
+@pytest.mark.parametrize("statements", [
+    ["a = a + 1"],
+    ["a = 1", "b = a", "a = b"],
+    ["f(x) = f(x)"],
+])
+def test_circular_definitions_rejected(workspace, statements):
+    with pytest.raises(ValueError, match="Circular"):
+        for statement in statements:
+            workspace.define(statement)
+
+
+def test_builtin_names_cannot_be_redefined(workspace):
+    with pytest.raises(ValueError):
+        workspace.define("sin = 3")
+
+
+def test_functions_see_variables_and_recompute(workspace):
+    workspace.define("k = 2")
+    workspace.define("scale(x) = k * x")
+    workspace.define("y = scale(5)")
+    assert workspace.evaluate("scale(3)") == 6
+    workspace.define("k = 3")
+    assert workspace.values["y"] == 15
+    assert workspace.evaluate("scale(3)") == 9
+
+
+def test_multi_parameter_functions(workspace):
+    workspace.define("hyp(a, b) = sqrt(a**2 + b**2)")
+    assert workspace.evaluate("hyp(3, 4)") == 5
+    with pytest.raises(ValueError):
+        workspace.evaluate("hyp(3)")
+
+
+def test_unsafe_definition_rejected(workspace):
+    with pytest.raises(ValueError):
+        workspace.define("a = ().__class__")